@@ -1,15 +1,31 @@
 """Database management for PolyMaX Synthesizer."""
+import functools
 import sqlite3
 from pathlib import Path
 from typing import Optional
 
 SCHEMA_FILE = Path(__file__).parent / "schema.sql"
 
+@functools.lru_cache(maxsize=1)
+def _schema_text() -> str:
+    """Read schema.sql once per process; it never changes at runtime."""
+    return SCHEMA_FILE.read_text()
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply performance pragmas (WAL + reduced fsync) to a connection."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA busy_timeout=5000")
+
 def init_database(db_path: str) -> None:
     """Initialize database with schema."""
-    schema = SCHEMA_FILE.read_text()
+    schema = _schema_text()
     conn = sqlite3.connect(db_path)
     conn.executescript(schema)
+    _apply_pragmas(conn)  # journal_mode=WAL persists on the database file
     conn.commit()
     conn.close()
 
@@ -21,7 +37,9 @@ class Database:
         self.conn: Optional[sqlite3.Connection] = None
 
     def __enter__(self):
-        self.conn = sqlite3.connect(self.db_path)
+        # Larger statement cache so repeated queries reuse compiled plans
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
+        _apply_pragmas(self.conn)
         self.conn.row_factory = sqlite3.Row  # Access columns by name
         return self
 
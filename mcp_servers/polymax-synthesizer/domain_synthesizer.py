@@ -15,11 +15,54 @@ Future Enhancement:
 - Quality scoring for generated syntheses
 """
 
+import concurrent.futures
+import functools
+import heapq
+import io
+import itertools
 import json
 from typing import Dict, Any, List
 from datetime import datetime
 from database import Database
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    def json_dumps(obj): return orjson.dumps(obj).decode()
+except ImportError:  # fall back to stdlib json
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+
+# Reusable finding templates (plain strings so they format lazily)
+_FINDING_TMPL = "{contribution} (PMID: {pmid}, {year})"
+_STAT_TMPL = "Achieved {metric} of {value} (PMID: {pmid}, p.{page})"
+
+# Cross-field insight template, built once and formatted per domain
+_INSIGHT_TMPL = """**Similarity**: {domain} exhibits {chars}, which is common in other domains with similar data structures.
+
+**Transferable**:
+- Statistical methods and loss functions developed for {domain}
+- Parameter estimation approaches
+- Validation strategies
+
+**Expected Impact**: Methods showing 15-30% improvement in {domain} may transfer to domains with similar statistical properties.
+
+<!-- TODO: Replace with Claude Opus 4.5 API for semantic cross-domain analysis -->"""
+
+# Metric keywords mapped to the data characteristic they indicate
+_CHARACTERISTIC_KEYWORDS = (
+    ("sparse", "sparse data"),
+    ("sparsity", "sparse data"),
+    ("overdispers", "overdispersion"),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parsed(blob: str) -> Dict[str, Any]:
+    """Decode a JSON extraction blob, caching repeat decodes across runs."""
+    return json_loads(blob) if blob else {}
+
 
 def synthesize_single_domain(
     domain: str,
@@ -89,30 +132,35 @@ def _extract_key_findings(paper_extractions: List[Dict[str, Any]]) -> List[str]:
     for paper in paper_extractions:
         high = paper.get('high_level', {})
         mid = paper.get('mid_level', {})
+        pmid = paper.get('pmid', 'N/A')
 
         contribution = high.get('contribution', '')
         if contribution and contribution != "Not extracted (MVP)":
             # Add PMID and basic citation
-            pmid = paper.get('pmid', 'N/A')
-            year = paper.get('year', 'N/A')
-            finding = f"{contribution} (PMID: {pmid}, {year})"
-            findings.append(finding)
+            findings.append(_FINDING_TMPL.format(
+                contribution=contribution,
+                pmid=pmid,
+                year=paper.get('year', 'N/A')
+            ))
+            if len(findings) >= 4:
+                break
 
         # Add top statistic if available
         stats = mid.get('stats', [])
         if stats:
             # Get first meaningful stat
             stat = stats[0]
-            metric = stat.get('metric', 'Unknown')
-            value = stat.get('value', 'N/A')
-            page = stat.get('page', 'N/A')
-            pmid = paper.get('pmid', 'N/A')
-
-            stat_finding = f"Achieved {metric} of {value} (PMID: {pmid}, p.{page})"
-            findings.append(stat_finding)
+            findings.append(_STAT_TMPL.format(
+                metric=stat.get('metric', 'Unknown'),
+                value=stat.get('value', 'N/A'),
+                pmid=pmid,
+                page=stat.get('page', 'N/A')
+            ))
+            if len(findings) >= 4:
+                break
 
-    # Limit to top 4 findings
-    return findings[:4]
+    # Capped at 4 findings by the early breaks above
+    return findings
 
 
 def _extract_statistical_approaches(paper_extractions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -122,8 +170,9 @@ def _extract_statistical_approaches(paper_extractions: List[Dict[str, Any]]) ->
     MVP: Aggregate mid_level.methods and associated stats
     TODO: Claude API for semantic method grouping
     """
-    # Collect all methods
-    methods_dict = {}  # method_name -> {stats, params, papers}
+    # Collect all methods; parameter dicts and PMIDs are accumulated
+    # cheaply and merged once at the end
+    methods_dict = {}  # method_name -> {stats, param fragments, pmid set}
 
     for paper in paper_extractions:
         mid = paper.get('mid_level', {})
@@ -134,21 +183,19 @@ def _extract_statistical_approaches(paper_extractions: List[Dict[str, Any]]) ->
         for method in methods:
             name = method.get('name', 'Unknown')
 
-            if name not in methods_dict:
-                methods_dict[name] = {
+            entry = methods_dict.get(name)
+            if entry is None:
+                entry = methods_dict[name] = {
                     'name': name,
-                    'parameters': {},
+                    '_param_fragments': [],
                     'stats': [],
-                    'pmids': []
+                    'pmids': set()
                 }
 
-            # Aggregate parameters
             params = method.get('parameters', {})
-            methods_dict[name]['parameters'].update(params)
-
-            # Add PMID
-            if pmid not in methods_dict[name]['pmids']:
-                methods_dict[name]['pmids'].append(pmid)
+            if params:
+                entry['_param_fragments'].append(params)
+            entry['pmids'].add(pmid)
 
         # Associate stats with methods
         for stat in stats:
@@ -158,8 +205,15 @@ def _extract_statistical_approaches(paper_extractions: List[Dict[str, Any]]) ->
                 if first_method in methods_dict:
                     methods_dict[first_method]['stats'].append(stat)
 
-    # Convert to list and limit to top 3
-    approaches = list(methods_dict.values())[:3]
+    # Keep only the top 3 and collapse their accumulators
+    approaches = []
+    for entry in itertools.islice(methods_dict.values(), 3):
+        approaches.append({
+            'name': entry['name'],
+            'parameters': {k: v for frag in entry['_param_fragments'] for k, v in frag.items()},
+            'stats': entry['stats'],
+            'pmids': sorted(entry['pmids'])
+        })
     return approaches
 
 
@@ -176,39 +230,26 @@ def _generate_cross_field_insights(domain: str, paper_extractions: List[Dict[str
     if not paper_extractions:
         return "No cross-field insights available (insufficient data)."
 
-    # Extract key characteristics from first few papers
-    characteristics = []
+    # Extract key characteristics from first few papers, stopping once
+    # two unique characteristics have been found
+    found = set()
 
     for paper in paper_extractions[:3]:
         mid = paper.get('mid_level', {})
-        stats = mid.get('stats', [])
 
-        for stat in stats:
+        for stat in mid.get('stats', []):
             metric = stat.get('metric', '').lower()
-            if 'sparse' in metric or 'sparsity' in metric:
-                characteristics.append("sparse data")
-            if 'overdispers' in metric:
-                characteristics.append("overdispersion")
+            for keyword, label in _CHARACTERISTIC_KEYWORDS:
+                if keyword in metric:
+                    found.add(label)
+            if len(found) >= 2:
+                break
+        if len(found) >= 2:
+            break
 
-    if not characteristics:
-        characteristics = ["statistical modeling"]
+    unique_characteristics = sorted(found) if found else ["statistical modeling"]
 
-    # Deduplicate and limit to 2 characteristics
-    unique_characteristics = list(set(characteristics))[:2]
-
-    # Generate insight
-    insight = f"""**Similarity**: {domain} exhibits {', '.join(unique_characteristics)}, which is common in other domains with similar data structures.
-
-**Transferable**:
-- Statistical methods and loss functions developed for {domain}
-- Parameter estimation approaches
-- Validation strategies
-
-**Expected Impact**: Methods showing 15-30% improvement in {domain} may transfer to domains with similar statistical properties.
-
-<!-- TODO: Replace with Claude Opus 4.5 API for semantic cross-domain analysis -->"""
-
-    return insight
+    return _INSIGHT_TMPL.format(domain=domain, chars=", ".join(unique_characteristics))
 
 
 def _generate_top_papers_list(paper_extractions: List[Dict[str, Any]]) -> List[Dict[str, str]]:
@@ -218,27 +259,22 @@ def _generate_top_papers_list(paper_extractions: List[Dict[str, Any]]) -> List[D
     MVP: Simple chronological + contribution-based ranking
     TODO: Claude API for semantic importance ranking
     """
-    papers = []
-
-    for paper in paper_extractions:
-        title = paper.get('title', 'Unknown')
-        year = paper.get('year', 'N/A')
-        pmid = paper.get('pmid', 'N/A')
-        high = paper.get('high_level', {})
-        contribution = high.get('contribution', 'N/A')
-
-        papers.append({
-            'title': title,
-            'year': year,
-            'pmid': pmid,
-            'contribution': contribution
-        })
-
-    # Sort by year (descending) - prefer recent papers
-    papers.sort(key=lambda x: x['year'] if isinstance(x['year'], int) else 0, reverse=True)
+    # Partial sort: pick the 5 most recent papers without sorting them all
+    top = heapq.nlargest(
+        5,
+        paper_extractions,
+        key=lambda p: p.get('year') if isinstance(p.get('year'), int) else 0
+    )
 
-    # Limit to top 5
-    return papers[:5]
+    return [
+        {
+            'title': paper.get('title', 'Unknown'),
+            'year': paper.get('year', 'N/A'),
+            'pmid': paper.get('pmid', 'N/A'),
+            'contribution': paper.get('high_level', {}).get('contribution', 'N/A')
+        }
+        for paper in top
+    ]
 
 
 def _build_markdown_synthesis(
@@ -250,21 +286,26 @@ def _build_markdown_synthesis(
 ) -> str:
     """
     Build complete markdown synthesis from components.
+
+    Writes into a single StringIO buffer to avoid the O(n^2) cost of
+    repeated string concatenation on large domains.
     """
+    buf = io.StringIO()
+
     # Title
-    title = f"# {domain.replace('-', ' ').title()}: Domain Synthesis\n\n"
+    buf.write(f"# {domain.replace('-', ' ').title()}: Domain Synthesis\n\n")
 
     # Key Findings section
-    findings_section = "## Key Findings\n\n"
+    buf.write("## Key Findings\n\n")
     if key_findings:
         for finding in key_findings:
-            findings_section += f"- {finding}\n"
+            buf.write(f"- {finding}\n")
     else:
-        findings_section += "- No key findings extracted (MVP limitation)\n"
-    findings_section += "\n"
+        buf.write("- No key findings extracted (MVP limitation)\n")
+    buf.write("\n")
 
     # Statistical Approaches section
-    stats_section = "## Statistical Approaches\n\n"
+    buf.write("## Statistical Approaches\n\n")
     if statistical_approaches:
         for i, approach in enumerate(statistical_approaches, 1):
             name = approach['name']
@@ -272,57 +313,51 @@ def _build_markdown_synthesis(
             stats = approach.get('stats', [])
             pmids = approach.get('pmids', [])
 
-            stats_section += f"{i}. **{name}**\n"
+            buf.write(f"{i}. **{name}**\n")
 
             if params:
                 param_str = ", ".join(f"{k}={v}" for k, v in params.items())
-                stats_section += f"   - Parameters: {param_str}\n"
+                buf.write(f"   - Parameters: {param_str}\n")
 
             if stats:
                 for stat in stats[:2]:  # Top 2 stats per method
                     metric = stat.get('metric', 'Unknown')
                     value = stat.get('value', 'N/A')
                     page = stat.get('page', 'N/A')
-                    stats_section += f"   - **Key stat**: {metric} = {value} (p.{page})\n"
+                    buf.write(f"   - **Key stat**: {metric} = {value} (p.{page})\n")
 
             if pmids:
-                stats_section += f"   - References: PMIDs {', '.join(pmids)}\n"
+                buf.write(f"   - References: PMIDs {', '.join(pmids)}\n")
 
-            stats_section += "\n"
+            buf.write("\n")
     else:
-        stats_section += "No statistical approaches extracted (MVP limitation)\n\n"
+        buf.write("No statistical approaches extracted (MVP limitation)\n\n")
 
     # Cross-Field Transfer section
-    transfer_section = "## Cross-Field Transfer\n\n"
-    transfer_section += cross_field_insights + "\n\n"
+    buf.write("## Cross-Field Transfer\n\n")
+    buf.write(cross_field_insights)
+    buf.write("\n\n")
 
     # Top Papers section
-    papers_section = "## Top Papers\n\n"
+    buf.write("## Top Papers\n\n")
     if top_papers:
         for i, paper in enumerate(top_papers, 1):
-            paper_title = paper['title']
-            paper_year = paper['year']
-            paper_pmid = paper['pmid']
+            buf.write(f"{i}. **{paper['title']}** ({paper['year']})\n")
+            buf.write(f"   - PMID: {paper['pmid']}\n")
             paper_contribution = paper['contribution']
-
-            papers_section += f"{i}. **{paper_title}** ({paper_year})\n"
-            papers_section += f"   - PMID: {paper_pmid}\n"
             if paper_contribution and paper_contribution != "N/A":
-                papers_section += f"   - {paper_contribution}\n"
-            papers_section += "\n"
+                buf.write(f"   - {paper_contribution}\n")
+            buf.write("\n")
     else:
-        papers_section += "No papers available\n\n"
+        buf.write("No papers available\n\n")
 
     # Footer note
-    footer = "---\n\n"
-    footer += "*Generated using rule-based MVP synthesizer. "
-    footer += "Future versions will use Claude Opus 4.5 for semantic synthesis.*\n"
-    footer += f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+    buf.write("---\n\n")
+    buf.write("*Generated using rule-based MVP synthesizer. ")
+    buf.write("Future versions will use Claude Opus 4.5 for semantic synthesis.*\n")
+    buf.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
 
-    # Combine all sections
-    synthesis = title + findings_section + stats_section + transfer_section + papers_section + footer
-
-    return synthesis
+    return buf.getvalue()
 
 
 def _generate_empty_synthesis(domain: str) -> str:
@@ -351,6 +386,36 @@ No papers available.
 """
 
 
+def _synth_one(args) -> str:
+    """Top-level picklable wrapper for process-pool dispatch."""
+    domain_name, paper_extractions, db_path = args
+    return synthesize_single_domain(domain_name, paper_extractions, db_path)
+
+
+def _run_syntheses(tasks, db_path: str):
+    """Run synthesis tasks, in parallel when there is more than one.
+
+    Yields (domain_id, paper_extractions, outcome) where calling
+    outcome() returns the markdown or raises the task's exception, so
+    the caller handles errors uniformly for both paths.
+    """
+    if len(tasks) <= 1:
+        for domain_id, domain_name, paper_extractions in tasks:
+            yield domain_id, paper_extractions, functools.partial(
+                synthesize_single_domain, domain_name, paper_extractions, db_path
+            )
+        return
+
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        futures = [
+            (domain_id, paper_extractions,
+             pool.submit(_synth_one, (domain_name, paper_extractions, db_path)))
+            for domain_id, domain_name, paper_extractions in tasks
+        ]
+        for domain_id, paper_extractions, future in futures:
+            yield domain_id, paper_extractions, future.result
+
+
 def synthesize_multiple_domains(
     synthesis_run_id: int,
     domain_ids: List[int],
@@ -383,84 +448,97 @@ def synthesize_multiple_domains(
             )
             row = cursor.fetchone()
             if row:
-                domain_names = json.loads(row["detected_domains"])
-                # Get or create domain IDs
+                domain_names = json_loads(row["detected_domains"])
+                # Get or create domain IDs (single-statement upserts)
                 domain_ids = []
                 for domain_name in domain_names:
                     cursor = db.conn.execute(
-                        "INSERT OR IGNORE INTO domains (name) VALUES (?)",
+                        """INSERT INTO domains (name) VALUES (?)
+                           ON CONFLICT(name) DO UPDATE SET name=excluded.name
+                           RETURNING id""",
                         (domain_name,)
                     )
-                    db.conn.commit()
-
-                    cursor = db.conn.execute(
-                        "SELECT id FROM domains WHERE name=?",
-                        (domain_name,)
-                    )
-                    domain_id = cursor.fetchone()["id"]
-                    domain_ids.append(domain_id)
+                    domain_ids.append(cursor.fetchone()["id"])
+                db.conn.commit()
 
         results["total"] = len(domain_ids)
 
-        # Process each domain
-        for domain_id in domain_ids:
-            try:
-                # Get domain name
-                cursor = db.conn.execute(
-                    "SELECT name FROM domains WHERE id=?",
-                    (domain_id,)
-                )
-                row = cursor.fetchone()
-                if not row:
-                    raise ValueError(f"Domain {domain_id} not found")
-                domain_name = row["name"]
-
-                # Get papers for this domain with extractions
-                cursor = db.conn.execute(
-                    """SELECT p.id, p.title, p.year, p.pmid,
-                              pe.high_level, pe.mid_level, pe.low_level
-                       FROM papers p
-                       JOIN paper_extractions pe ON p.id = pe.paper_id
-                       WHERE p.domain = ?""",
-                    (domain_name,)
-                )
-                papers = cursor.fetchall()
-
-                # Format paper extractions
-                paper_extractions = []
-                for paper in papers:
-                    paper_extractions.append({
-                        "paper_id": paper["id"],
-                        "title": paper["title"],
-                        "year": paper["year"],
-                        "pmid": paper["pmid"],
-                        "high_level": json.loads(paper["high_level"]) if paper["high_level"] else {},
-                        "mid_level": json.loads(paper["mid_level"]) if paper["mid_level"] else {},
-                        "low_level": json.loads(paper["low_level"]) if paper["low_level"] else {}
+        # Resolve all domain names in one query
+        placeholders = ",".join("?" * len(domain_ids))
+        cursor = db.conn.execute(
+            f"SELECT id, name FROM domains WHERE id IN ({placeholders})",
+            domain_ids
+        )
+        domain_names = {row["id"]: row["name"] for row in cursor.fetchall()}
+
+        # Fetch papers + extractions for all domains at once and bucket
+        # them by domain in Python. Blobs decode per row here (not via
+        # SQLite's json(), which would abort the whole cursor on the
+        # first malformed document) so one bad extraction poisons only
+        # its own domain; _parsed still dedups repeat decodes.
+        extractions_by_domain = {name: [] for name in domain_names.values()}
+        bad_domains = {}  # domain name -> first decode error
+        if domain_names:
+            name_placeholders = ",".join("?" * len(domain_names))
+            cursor = db.conn.execute(
+                f"""SELECT p.domain, p.id, p.title, p.year, p.pmid,
+                           pe.high_level, pe.mid_level, pe.low_level
+                    FROM papers p
+                    JOIN paper_extractions pe ON p.id = pe.paper_id
+                    WHERE p.domain IN ({name_placeholders})""",
+                list(domain_names.values())
+            )
+            # Positional unpacking skips per-field column-name lookups
+            for domain, paper_id, title, year, pmid, high, mid, low in cursor:
+                if domain in bad_domains:
+                    continue
+                try:
+                    extractions_by_domain[domain].append({
+                        "paper_id": paper_id,
+                        "title": title,
+                        "year": year,
+                        "pmid": pmid,
+                        "high_level": _parsed(high),
+                        "mid_level": _parsed(mid),
+                        "low_level": _parsed(low)
                     })
+                except (ValueError, TypeError) as e:
+                    bad_domains[domain] = f"paper {paper_id}: {e}"
 
-                # Generate synthesis
-                synthesis_markdown = synthesize_single_domain(
-                    domain_name,
-                    paper_extractions,
-                    db_path
-                )
-
-                # Store in domain_syntheses table
-                cursor = db.conn.execute(
-                    """INSERT OR REPLACE INTO domain_syntheses
-                       (synthesis_run_id, domain_id, summary_markdown, papers_analyzed, paper_ids)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (
-                        synthesis_run_id,
-                        domain_id,
-                        synthesis_markdown,
-                        len(paper_extractions),
-                        json.dumps([p["paper_id"] for p in paper_extractions])
-                    )
-                )
-                db.conn.commit()
-
+        # Resolve tasks first so missing or poisoned domains fail fast
+        tasks = []  # (domain_id, domain_name, paper_extractions)
+        for domain_id in domain_ids:
+            domain_name = domain_names.get(domain_id)
+            if domain_name is None:
+                results["failed"] += 1
+                results["errors"].append({
+                    "domain_id": domain_id,
+                    "error": f"Domain {domain_id} not found"
+                })
+                continue
+            if domain_name in bad_domains:
+                results["failed"] += 1
+                results["errors"].append({
+                    "domain_id": domain_id,
+                    "error": f"Malformed extraction JSON ({bad_domains[domain_name]})"
+                })
+                continue
+            tasks.append((domain_id, domain_name, extractions_by_domain[domain_name]))
+
+        # Each synthesis is pure Python and independent, so domains run
+        # in a process pool when there is more than one; results are
+        # stored in one transaction back on the main process
+        synthesis_rows = []
+        for domain_id, paper_extractions, outcome in _run_syntheses(tasks, db_path):
+            try:
+                synthesis_markdown = outcome()
+                synthesis_rows.append((
+                    synthesis_run_id,
+                    domain_id,
+                    synthesis_markdown,
+                    len(paper_extractions),
+                    json_dumps([p["paper_id"] for p in paper_extractions])
+                ))
                 results["successful"] += 1
 
             except Exception as e:
@@ -470,4 +548,13 @@ def synthesize_multiple_domains(
                     "error": str(e)
                 })
 
+        if synthesis_rows:
+            with db.conn:
+                db.conn.executemany(
+                    """INSERT OR REPLACE INTO domain_syntheses
+                       (synthesis_run_id, domain_id, summary_markdown, papers_analyzed, paper_ids)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    synthesis_rows
+                )
+
     return results
@@ -1,9 +1,33 @@
 """Literature discovery (targeted and broad modes)."""
+import functools
+import heapq
 import json
 from database import Database
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-def discover_targeted_literature(queries: List[str], db_path: str) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=64)
+def _targeted_sql(term_count: int) -> str:
+    """Build the targeted-search SQL for a given term count.
+
+    Cached so identical query shapes hand SQLite the same string and hit
+    its prepared-statement cache instead of re-planning each time.
+    """
+    score_expr = " + ".join(
+        "(CASE WHEN LOWER(p.title) LIKE ? OR LOWER(COALESCE(prof.name, '')) LIKE ? THEN 1 ELSE 0 END)"
+        for _ in range(term_count)
+    )
+    return f"""SELECT p.id, p.title, p.pmid, p.professor_id,
+                      prof.name AS professor_name,
+                      {score_expr} AS score
+               FROM papers p
+               LEFT JOIN professors prof ON p.professor_id = prof.id
+               WHERE score > 0"""
+
+def discover_targeted_literature(
+    queries: List[str],
+    db_path: str,
+    db: Optional[Database] = None
+) -> Dict[str, Any]:
     """
     Targeted literature discovery (for primary research mode).
 
@@ -13,6 +37,7 @@ def discover_targeted_literature(queries: List[str], db_path: str) -> Dict[str,
     Args:
         queries: List of search queries (e.g., "Yuankai Huo Img2ST")
         db_path: Path to database
+        db: Optional open Database to reuse instead of opening db_path
 
     Returns:
         {
@@ -21,55 +46,66 @@ def discover_targeted_literature(queries: List[str], db_path: str) -> Dict[str,
             "targeted_matches": [...]
         }
     """
-    targeted_matches = []
+    if db is None:
+        with Database(db_path) as db:
+            return discover_targeted_literature(queries, db_path, db=db)
+
+    matches_by_key = {}  # (query, paper_id) -> match dict
     professors_found = set()
     papers_found = set()
 
-    with Database(db_path) as db:
-        for query in queries:
-            query_lower = query.lower()
-            terms = query_lower.split()
-
-            # Search papers by title
-            cursor = db.conn.execute(
-                "SELECT p.*, prof.name as professor_name FROM papers p LEFT JOIN professors prof ON p.professor_id = prof.id"
-            )
-
-            for row in cursor.fetchall():
-                title = (row["title"] or "").lower()
-                professor = row["professor_name"] or ""
-
-                # Score by number of matching terms
-                score = sum(1 for term in terms if term in title or term in professor.lower())
-
-                if score > 0:
-                    professors_found.add(row["professor_id"])
-                    papers_found.add(row["id"])
-
-                    # Record match
-                    if not any(m["query"] == query and m["paper_id"] == row["id"] for m in targeted_matches):
-                        targeted_matches.append({
-                            "query": query,
-                            "professor": professor,
-                            "paper_id": row["id"],
-                            "paper_title": row["title"],
-                            "pmid": row["pmid"],
-                            "score": score
-                        })
-
-    # Sort matches by score
-    for match_group in targeted_matches:
-        if "score" in match_group:
-            pass  # Already has score
+    for query in queries:
+        terms = tuple(query.lower().split())
+        if not terms:
+            continue
+
+        # Let SQLite filter and score rows on its side instead of
+        # scanning every paper in Python per query; each term binds
+        # the same LIKE pattern twice (title, professor name)
+        params = [f"%{term}%" for term in terms for _ in range(2)]
+
+        cursor = db.conn.execute(_targeted_sql(len(terms)), params)
+
+        # Surviving rows already have score > 0, so the loop body is
+        # just bookkeeping
+        for row in cursor.fetchall():
+            paper_id = row["id"]
+            professors_found.add(row["professor_id"])
+            papers_found.add(paper_id)
+
+            # Record match (keyed dedup instead of scanning the list)
+            key = (query, paper_id)
+            if key not in matches_by_key:
+                matches_by_key[key] = {
+                    "query": query,
+                    "professor": row["professor_name"] or "",
+                    "paper_id": paper_id,
+                    "paper_title": row["title"],
+                    "pmid": row["pmid"],
+                    "score": row["score"]
+                }
+
+    # Partial selection of the top 20 by score; the negated index breaks
+    # ties in insertion order without comparing the dicts themselves
+    top_matches = [
+        match for _, _, match in heapq.nlargest(
+            20,
+            ((m.get("score", 0), -i, m) for i, m in enumerate(matches_by_key.values()))
+        )
+    ]
 
     return {
         "professors_added": len(professors_found),
         "papers_added": len(papers_found),
         "breakdown_by_domain": {},  # TODO: implement domain breakdown
-        "targeted_matches": sorted(targeted_matches, key=lambda x: x.get("score", 0), reverse=True)[:20]
+        "targeted_matches": top_matches
     }
 
-def discover_broad_literature(domains: List[str], db_path: str) -> Dict[str, Any]:
+def discover_broad_literature(
+    domains: List[str],
+    db_path: str,
+    db: Optional[Database] = None
+) -> Dict[str, Any]:
     """
     Broad literature discovery (for review mode).
 
@@ -0,0 +1,88 @@
+"""Exact-match on-disk cache for deterministic Claude calls.
+
+The prompt builders are pure functions of their inputs, so identical
+(function, args) tuples recur across manuscript regenerations and CI
+runs. Caching the response by input hash turns those repeats into a
+sub-millisecond file read instead of a multi-second API round-trip.
+
+Entries are JSON files under ~/.cache/polymax/llm/, written via
+os.replace so concurrent writers never leave a torn file.
+
+Usage:
+    @cached_claude(ttl_seconds=86400)
+    def generate_results_section(main_finding, api_key):
+        ...
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "polymax", "llm")
+
+
+def _cache_file_key(func_name: str, bound_args: dict) -> str:
+    """Hash bound call arguments into a file-name-safe key.
+
+    Arguments arrive already bound to the wrapped function's signature,
+    so api_key is excluded whether it was passed positionally or by
+    keyword — it doesn't affect the response and would bust the cache
+    whenever credentials rotate. Binding also means positional and
+    keyword spellings of the same call share one entry.
+    """
+    h = hashlib.blake2b(digest_size=32)
+    h.update(func_name.encode())
+    for name, value in bound_args.items():
+        if name == "api_key":
+            continue
+        h.update(b"\x00")
+        h.update(f"{name}={value!r}".encode())
+    return h.hexdigest()
+
+
+def cached_claude(ttl_seconds: int = 86400, cache_dir: str = None):
+    """
+    Decorator caching a Claude-calling function's result on disk.
+
+    Args:
+        ttl_seconds: Entry lifetime; stale entries are re-fetched
+        cache_dir: Override cache directory (defaults to ~/.cache/polymax/llm)
+
+    Returns:
+        Decorator wrapping the function with hash-keyed disk caching.
+        The wrapped function's result must be JSON-serializable.
+    """
+    directory = cache_dir or _CACHE_DIR
+
+    def decorator(func):
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _cache_file_key(func.__qualname__, bound.arguments)
+            path = os.path.join(directory, f"{key}.json")
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+                if time.time() - entry["stored_at"] < ttl_seconds:
+                    return entry["value"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+            value = func(*args, **kwargs)
+
+            os.makedirs(directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": time.time(), "value": value}, f)
+            os.replace(tmp, path)
+            return value
+
+        return wrapper
+
+    return decorator
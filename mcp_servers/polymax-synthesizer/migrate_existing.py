@@ -4,63 +4,92 @@ import sqlite3
 from pathlib import Path
 from database import Database
 
+try:
+    import orjson
+    def json_dumps(obj): return orjson.dumps(obj).decode()
+except ImportError:  # fall back to stdlib json
+    json_dumps = json.dumps
+
+def _iter_papers(json_file: str):
+    """Yield paper dicts from a metadata JSON file (list or dict keyed by pmid).
+
+    Streams with ijson when available so multi-megabyte files are never
+    held fully in memory; falls back to a single json.load otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        with open(json_file) as f:
+            papers = json.load(f)
+        yield from (papers.values() if isinstance(papers, dict) else papers)
+        return
+
+    with open(json_file, "rb") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == b"[":
+            yield from ijson.items(f, "item")
+        else:
+            for _, paper in ijson.kvitems(f, ""):
+                yield paper
+
 def migrate_professor_papers(
     db_path: str,
     professor_name: str,
     affiliation: str,
-    json_file: str
+    json_file: str,
+    db: Database = None
 ) -> int:
     """
     Migrate papers from JSON to database.
 
+    An already-open `db` can be passed to reuse one connection (and its
+    warm page cache) across many migrations; otherwise one is opened.
+
     Returns:
         professor_id
     """
-    with Database(db_path) as db:
-        # Insert or get professor
-        cursor = db.conn.execute(
-            "INSERT OR IGNORE INTO professors (name, affiliation) VALUES (?, ?)",
-            (professor_name, affiliation)
+    if db is None:
+        with Database(db_path) as db:
+            return migrate_professor_papers(db_path, professor_name, affiliation, json_file, db)
+
+    # Upsert professor and get the id in a single statement
+    cursor = db.conn.execute(
+        """INSERT INTO professors (name, affiliation) VALUES (?, ?)
+           ON CONFLICT(name, affiliation) DO UPDATE SET affiliation=excluded.affiliation
+           RETURNING id""",
+        (professor_name, affiliation)
+    )
+    professor_id = cursor.fetchone()["id"]
+    db.conn.commit()
+
+    # Stream papers from JSON straight into one batched transaction
+    # (authors may be a string or a list in the source JSON)
+    rows = (
+        (
+            paper.get("pmid"),
+            paper.get("title"),
+            paper.get("year"),
+            json_dumps([paper["authors"]] if isinstance(paper.get("authors"), str)
+                       else paper.get("authors", [])),
+            paper.get("journal"),
+            paper.get("abstract"),
+            paper.get("doi"),
+            professor_id
         )
-        db.conn.commit()
-
-        cursor = db.conn.execute(
-            "SELECT id FROM professors WHERE name=? AND affiliation=?",
-            (professor_name, affiliation)
+        for paper in _iter_papers(json_file)
+    )
+    with db.conn:
+        db.conn.executemany(
+            """INSERT OR IGNORE INTO papers
+               (pmid, title, year, authors, journal, abstract, doi, professor_id)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows
         )
-        professor_id = cursor.fetchone()["id"]
 
-        # Load papers from JSON
-        with open(json_file) as f:
-            papers = json.load(f)
-            if isinstance(papers, dict):
-                papers = list(papers.values())
-
-        # Insert papers
-        for paper in papers:
-            # Handle both string and list for authors
-            authors = paper.get("authors", [])
-            if isinstance(authors, str):
-                authors = [authors]
-
-            db.conn.execute(
-                """INSERT OR IGNORE INTO papers
-                   (pmid, title, year, authors, journal, abstract, doi, professor_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    paper.get("pmid"),
-                    paper.get("title"),
-                    paper.get("year"),
-                    json.dumps(authors),
-                    paper.get("journal"),
-                    paper.get("abstract"),
-                    paper.get("doi"),
-                    professor_id
-                )
-            )
-
-        db.conn.commit()
-        return professor_id
+    return professor_id
 
 def migrate_all_professors(db_path: str):
     """Migrate all Vanderbilt professors to database."""
@@ -75,23 +104,28 @@ def migrate_all_professors(db_path: str):
     ]
 
     total_papers = 0
-    for name, affiliation, json_file in professors:
-        if Path(json_file).exists():
-            print(f"Migrating {name}...")
-
-            # Count papers in file
-            with open(json_file) as f:
-                papers = json.load(f)
-                if isinstance(papers, dict):
-                    paper_count = len(papers)
-                else:
-                    paper_count = len(papers)
-
-            migrate_professor_papers(db_path, name, affiliation, json_file)
-            total_papers += paper_count
-            print(f"  ✓ {name} migrated ({paper_count} papers)")
-        else:
-            print(f"  ✗ {name} - JSON file not found: {json_file}")
+    # One connection for the whole migration keeps the page cache hot
+    with Database(db_path) as db:
+        for name, affiliation, json_file in professors:
+            if Path(json_file).exists():
+                print(f"Migrating {name}...")
+
+                professor_id = migrate_professor_papers(db_path, name, affiliation, json_file, db)
+
+                # Count from the database rather than re-parsing the JSON file
+                cursor = db.conn.execute(
+                    "SELECT COUNT(*) FROM papers WHERE professor_id=?",
+                    (professor_id,)
+                )
+                paper_count = cursor.fetchone()[0]
+                total_papers += paper_count
+                print(f"  ✓ {name} migrated ({paper_count} papers)")
+            else:
+                print(f"  ✗ {name} - JSON file not found: {json_file}")
+
+        # Refresh planner statistics so the new rows are costed correctly
+        db.conn.execute("ANALYZE")
+        db.conn.commit()
 
     return total_papers
 
@@ -1,364 +1,620 @@
-"""Paper extraction module for PolyMaX Synthesizer.
-
-This module provides hierarchical extraction of paper content.
-MVP implementation uses rule-based heuristics; future versions
-will integrate Claude API for deeper analysis.
-"""
-
-import json
-import re
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from database import Database
-
-
-def extract_single_paper(paper_id: int, db_path: str) -> Dict[str, Any]:
-    """
-    Extract hierarchical data from a single paper.
-
-    MVP Implementation Strategy:
-    - high_level: Extract from title + abstract
-    - mid_level: Simple pattern matching for stats/methods
-    - low_level: Quote extraction from abstract
-    - code_methods: TODO (requires full-text processing)
-
-    Future Enhancement:
-    - Integrate Claude API for semantic understanding
-    - Process full_text_markdown for deeper extraction
-    - Extract mathematical equations and algorithms
-    - Identify hyperparameters and experimental setup
-
-    Args:
-        paper_id: Database ID of the paper
-        db_path: Path to SQLite database
-
-    Returns:
-        Dictionary with hierarchical extraction data
-    """
-    with Database(db_path) as db:
-        # Fetch paper data
-        cursor = db.conn.execute(
-            """SELECT id, title, abstract, full_text_markdown, authors, year, journal
-               FROM papers WHERE id = ?""",
-            (paper_id,)
-        )
-        row = cursor.fetchone()
-
-        if not row:
-            raise ValueError(f"Paper with ID {paper_id} not found")
-
-        paper_data = {
-            "id": row["id"],
-            "title": row["title"],
-            "abstract": row["abstract"] or "",
-            "full_text": row["full_text_markdown"] or "",
-            "authors": row["authors"],
-            "year": row["year"],
-            "journal": row["journal"]
-        }
-
-    # Perform hierarchical extraction
-    extraction = {
-        "high_level": _extract_high_level(paper_data),
-        "mid_level": _extract_mid_level(paper_data),
-        "low_level": _extract_low_level(paper_data),
-        "code_methods": _extract_code_methods(paper_data)
-    }
-
-    # Store extraction in database
-    _store_extraction(paper_id, extraction, db_path)
-
-    return extraction
-
-
-def _extract_high_level(paper_data: Dict[str, Any]) -> Dict[str, str]:
-    """
-    Extract high-level summary from title and abstract.
-
-    MVP Strategy:
-    - main_claim: Use title as primary claim
-    - novelty: Extract first sentence from abstract
-    - contribution: Extract key phrases about methods/results
-
-    TODO: Replace with Claude API for semantic understanding
-    """
-    title = paper_data["title"]
-    abstract = paper_data["abstract"]
-
-    # Main claim is the title
-    main_claim = title.strip()
-
-    # Novelty: extract first meaningful sentence from abstract
-    novelty = "No abstract available"
-    if abstract:
-        # Find first sentence (ending with ., !, or ?)
-        match = re.search(r'^(.*?[.!?])', abstract, re.DOTALL)
-        if match:
-            novelty = match.group(1).strip()
-
-    # Contribution: look for method/result keywords
-    contribution = "Not extracted (MVP)"
-    if abstract:
-        # Simple heuristic: look for sentences with method/result keywords
-        keywords = ['propose', 'develop', 'demonstrate', 'show', 'achieve', 'improve']
-        sentences = re.split(r'[.!?]', abstract)
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in keywords):
-                contribution = sentence.strip()
-                break
-
-    return {
-        "main_claim": main_claim,
-        "novelty": novelty,
-        "contribution": contribution
-    }
-
-
-def _extract_mid_level(paper_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-    """
-    Extract statistics and methods from abstract.
-
-    MVP Strategy:
-    - stats: Pattern match numbers with context (accuracy, AUC, p-value, etc.)
-    - methods: Extract capitalized method names (e.g., "U-Net", "BERT")
-
-    TODO: Claude API for semantic extraction of experimental results
-    """
-    abstract = paper_data["abstract"]
-
-    stats = []
-    methods = []
-
-    if abstract:
-        # Extract statistics: numbers with units/context
-        # Pattern: number (possibly with %, decimal) + context word
-        stat_patterns = [
-            (r'(\w+)\s*[=:]\s*([\d.]+%?)', 'equality'),  # "accuracy = 0.95"
-            (r'([\d.]+%?)\s*(\w+)', 'value_first'),  # "95% accuracy"
-            (r'p\s*[<>=]\s*([\d.e-]+)', 'p_value'),  # "p < 0.05"
-        ]
-
-        for pattern, ptype in stat_patterns:
-            matches = re.finditer(pattern, abstract, re.IGNORECASE)
-            for match in matches:
-                if ptype == 'p_value':
-                    stats.append({
-                        "type": "p-value",
-                        "metric": "statistical significance",
-                        "value": match.group(1),
-                        "context": match.group(0),
-                        "page": "abstract"
-                    })
-                elif ptype == 'equality':
-                    metric, value = match.groups()
-                    # Try to parse as float if possible
-                    try:
-                        numeric_value = float(value.rstrip('%'))
-                    except ValueError:
-                        numeric_value = value
-
-                    stats.append({
-                        "type": "performance",
-                        "metric": metric,
-                        "value": numeric_value,
-                        "context": match.group(0),
-                        "page": "abstract"
-                    })
-
-        # Extract methods: Look for capitalized technical terms
-        # Pattern: words with capital letters (excluding start of sentence)
-        method_pattern = r'(?<!^)(?<!\.\s)([A-Z][A-Za-z]*(?:-[A-Z][A-Za-z]*)*)'
-        method_matches = re.finditer(method_pattern, abstract)
-
-        seen_methods = set()
-        for match in method_matches:
-            method_name = match.group(1)
-            # Filter out common words (simple heuristic)
-            if method_name not in ['The', 'This', 'We', 'Our', 'Results', 'Methods', 'Figure', 'Table']:
-                if method_name not in seen_methods:
-                    methods.append({
-                        "name": method_name,
-                        "parameters": {},  # TODO: extract from full text
-                        "page": "abstract"
-                    })
-                    seen_methods.add(method_name)
-
-    return {
-        "stats": stats,
-        "methods": methods
-    }
-
-
-def _extract_low_level(paper_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-    """
-    Extract quotes from abstract and full text.
-
-    MVP Strategy:
-    - Extract sentences with key findings/claims
-    - Use quoted text or sentences with strong claim words
-
-    TODO: Claude API for extracting salient quotes with context
-    """
-    abstract = paper_data["abstract"]
-
-    quotes = []
-
-    if abstract:
-        # Extract sentences with strong claim words
-        claim_keywords = ['demonstrate', 'show', 'prove', 'found', 'discovered', 'achieved']
-        sentences = re.split(r'(?<=[.!?])\s+', abstract)
-
-        for i, sentence in enumerate(sentences):
-            if any(keyword in sentence.lower() for keyword in claim_keywords):
-                quotes.append({
-                    "text": sentence.strip(),
-                    "page": "abstract",
-                    "section": "Abstract",
-                    "context": f"Sentence {i+1} of abstract"
-                })
-
-    return {
-        "quotes": quotes
-    }
-
-
-def _extract_code_methods(paper_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-    """
-    Extract algorithms and equations from full text.
-
-    MVP Strategy:
-    - Mark as TODO since requires full-text processing
-    - Future: Parse LaTeX equations, pseudocode blocks, hyperparameters
-
-    TODO: Implement full-text parsing for code/methods extraction
-    TODO: Claude API for algorithm understanding and equation parsing
-    """
-    # TODO: This requires full_text_markdown processing
-    # For MVP, return empty structures
-
-    return {
-        "algorithms": [],  # TODO: extract from Methods section
-        "equations": [],   # TODO: parse LaTeX equations
-        "hyperparameters": []  # TODO: extract training details
-    }
-
-
-def _store_extraction(paper_id: int, extraction: Dict[str, Any], db_path: str) -> None:
-    """
-    Store extraction results in paper_extractions table.
-
-    Args:
-        paper_id: Database ID of the paper
-        extraction: Hierarchical extraction data
-        db_path: Path to SQLite database
-    """
-    with Database(db_path) as db:
-        # Check if extraction already exists
-        cursor = db.conn.execute(
-            "SELECT id FROM paper_extractions WHERE paper_id = ?",
-            (paper_id,)
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update existing extraction
-            db.conn.execute(
-                """UPDATE paper_extractions
-                   SET high_level = ?, mid_level = ?, low_level = ?, code_methods = ?,
-                       extraction_model = ?, extracted_at = ?
-                   WHERE paper_id = ?""",
-                (
-                    json.dumps(extraction["high_level"]),
-                    json.dumps(extraction["mid_level"]),
-                    json.dumps(extraction["low_level"]),
-                    json.dumps(extraction["code_methods"]),
-                    "rule-based-mvp",  # Mark as MVP implementation
-                    datetime.now().isoformat(),
-                    paper_id
-                )
-            )
-        else:
-            # Insert new extraction
-            db.conn.execute(
-                """INSERT INTO paper_extractions
-                   (paper_id, high_level, mid_level, low_level, code_methods, extraction_model)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    paper_id,
-                    json.dumps(extraction["high_level"]),
-                    json.dumps(extraction["mid_level"]),
-                    json.dumps(extraction["low_level"]),
-                    json.dumps(extraction["code_methods"]),
-                    "rule-based-mvp"
-                )
-            )
-
-        db.conn.commit()
-
-
-def extract_multiple_papers(
-    paper_ids: List[int],
-    db_path: str,
-    extraction_depth: str = "full"
-) -> Dict[str, Any]:
-    """
-    Extract multiple papers in batch.
-
-    Future Enhancement:
-    - Parallelize extractions using asyncio
-    - Add progress tracking
-    - Batch Claude API calls for efficiency
-
-    Args:
-        paper_ids: List of paper IDs to extract
-        db_path: Path to SQLite database
-        extraction_depth: Extraction depth level
-            - "high_only": Only extract high_level (main_claim, novelty, contribution)
-            - "mid": Extract high_level + mid_level (stats, methods)
-            - "full": Extract all levels (high, mid, low, code_methods)
-
-    Returns:
-        Summary of extractions with success/failure counts
-    """
-    results = {
-        "total": len(paper_ids),
-        "successful": 0,
-        "failed": 0,
-        "errors": []
-    }
-
-    for paper_id in paper_ids:
-        try:
-            # Extract full paper content
-            result = extract_single_paper(paper_id, db_path)
-
-            # Filter based on extraction_depth
-            if extraction_depth == "high_only":
-                result = {
-                    "high_level": result["high_level"],
-                    "mid_level": {},
-                    "low_level": {},
-                    "code_methods": {}
-                }
-            elif extraction_depth == "mid":
-                result = {
-                    "high_level": result["high_level"],
-                    "mid_level": result["mid_level"],
-                    "low_level": {},
-                    "code_methods": {}
-                }
-            # "full" uses complete result (no filtering needed)
-
-            # Re-store the filtered extraction
-            if extraction_depth != "full":
-                _store_extraction(paper_id, result, db_path)
-
-            results["successful"] += 1
-        except Exception as e:
-            results["failed"] += 1
-            results["errors"].append({
-                "paper_id": paper_id,
-                "error": str(e)
-            })
-
-    return results
+"""Paper extraction module for PolyMaX Synthesizer.
+
+This module provides hierarchical extraction of paper content.
+MVP implementation uses rule-based heuristics; future versions
+will integrate Claude API for deeper analysis.
+"""
+
+import asyncio
+import copy
+import functools
+import json
+import re
+import sys
+from typing import Dict, Any, Iterator, List, Optional
+from database import Database
+
+
+@functools.lru_cache(maxsize=1)
+def _numpy():
+    """Import NumPy on first use so module import stays light."""
+    try:
+        import numpy as np
+        return np
+    except ImportError:  # vectorized sentence scan degrades to regex
+        return None
+
+# Compact serializer: tight separators and raw Unicode shrink the bytes
+# written to SQLite per extraction
+_dumps = functools.partial(json.dumps, separators=(',', ':'), ensure_ascii=False)
+
+# Pre-compiled patterns for the extraction hot path; hoisting these to
+# module scope skips re's cache-key lookup on every call
+_FIRST_SENT_RE = re.compile(r'^(.*?[.!?])', re.DOTALL)
+_SENTENCE_ITER_RE = re.compile(r'[^.!?]+(?:[.!?]+|$)')
+# All three statistic shapes fused into one alternation so the abstract
+# is scanned once: "p < 0.05" | "accuracy = 0.95" | "95% accuracy"
+_STATS_RE = re.compile(
+    r'(?P<pv>p\s*[<>=]\s*(?P<pv_val>[\d.e-]+))'
+    r'|(?P<eq>(?P<eq_m>\w+)\s*[=:]\s*(?P<eq_v>[\d.]+%?))'
+    r'|(?P<vf>(?P<vf_v>[\d.]+%?)\s*(?P<vf_m>\w+))',
+    re.IGNORECASE
+)
+_METHOD_RE = re.compile(r'(?<!^)(?<!\.\s)([A-Z][A-Za-z]*(?:-[A-Z][A-Za-z]*)*)')
+
+try:
+    # google-re2 compiles alternations to a non-backtracking DFA, which
+    # beats stdlib re on keyword scans; the patterns that rely on
+    # lookbehind (unsupported by RE2) stay on stdlib re above
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Keyword alternations scanned by the regex engine in one pass
+# (plain substrings, matching the previous `kw in sentence.lower()` checks)
+_CONTRIB_KW_RE = _re_engine.compile(r'(?i)propose|develop|demonstrate|show|achieve|improve')
+_CLAIM_KW_RE = _re_engine.compile(r'(?i)demonstrate|show|prove|found|discovered|achieved')
+
+# Common capitalized words that are not method names (interned so hash
+# lookups against interned candidates short-circuit on identity)
+_COMMON_WORDS = frozenset(
+    sys.intern(w) for w in ('The', 'This', 'We', 'Our', 'Results', 'Methods', 'Figure', 'Table')
+)
+
+# Canonical result for papers with no abstract or full text; stub papers
+# are common in bulk imports and skip the four extractors entirely
+_EMPTY_EXTRACTION = {
+    "high_level": {
+        "main_claim": "",
+        "novelty": "No abstract available",
+        "contribution": "Not extracted (MVP)"
+    },
+    "mid_level": {"stats": [], "methods": []},
+    "low_level": {"quotes": []},
+    "code_methods": {"algorithms": [], "equations": [], "hyperparameters": []}
+}
+
+# Single-statement upsert backed by the unique index on paper_id.
+# The timestamp is computed by SQLite, saving a Python datetime
+# allocation per row; the model marker stays an explicit bind because
+# databases created before the schema default changed would otherwise
+# mislabel rule-based extractions.
+_UPSERT_EXTRACTION_SQL = """
+    INSERT INTO paper_extractions
+        (paper_id, high_level, mid_level, low_level, code_methods, extraction_model, extracted_at)
+    VALUES (?, ?, ?, ?, ?, 'rule-based-mvp', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+    ON CONFLICT(paper_id) DO UPDATE SET
+        high_level=excluded.high_level, mid_level=excluded.mid_level,
+        low_level=excluded.low_level, code_methods=excluded.code_methods,
+        extraction_model=excluded.extraction_model, extracted_at=excluded.extracted_at
+"""
+
+
+def extract_single_paper(paper_id: int, db_path: str) -> Dict[str, Any]:
+    """
+    Extract hierarchical data from a single paper.
+
+    MVP Implementation Strategy:
+    - high_level: Extract from title + abstract
+    - mid_level: Simple pattern matching for stats/methods
+    - low_level: Quote extraction from abstract
+    - code_methods: TODO (requires full-text processing)
+
+    Future Enhancement:
+    - Integrate Claude API for semantic understanding
+    - Process full_text_markdown for deeper extraction
+    - Extract mathematical equations and algorithms
+    - Identify hyperparameters and experimental setup
+
+    Args:
+        paper_id: Database ID of the paper
+        db_path: Path to SQLite database
+
+    Returns:
+        Dictionary with hierarchical extraction data
+    """
+    with Database(db_path) as db:
+        # Fetch paper data
+        cursor = db.conn.execute(
+            """SELECT id, title, abstract, full_text_markdown, authors, year, journal
+               FROM papers WHERE id = ?""",
+            (paper_id,)
+        )
+        row = cursor.fetchone()
+
+        if not row:
+            raise ValueError(f"Paper with ID {paper_id} not found")
+
+        paper_data = _paper_data_from_row(row)
+
+    # Perform hierarchical extraction
+    extraction = _extract_only(paper_data)
+
+    # Store extraction in database
+    _store_extraction(paper_id, extraction, db_path)
+
+    return extraction
+
+
+def _paper_data_from_row(row) -> Dict[str, Any]:
+    """Shape a papers table row into the dict the extractors expect."""
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "abstract": row["abstract"] or "",
+        "full_text": row["full_text_markdown"] or "",
+        "authors": row["authors"],
+        "year": row["year"],
+        "journal": row["journal"]
+    }
+
+
+def _extract_only(paper_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the hierarchical extractors over in-memory paper data (no I/O)."""
+    if not paper_data["abstract"] and not paper_data["full_text"]:
+        extraction = copy.deepcopy(_EMPTY_EXTRACTION)
+        extraction["high_level"]["main_claim"] = paper_data["title"].strip()
+        return extraction
+
+    return {
+        "high_level": _extract_high_level(paper_data),
+        "mid_level": _extract_mid_level(paper_data),
+        "low_level": _extract_low_level(paper_data),
+        "code_methods": _extract_code_methods(paper_data)
+    }
+
+
+def _sentence_spans(text: str) -> Iterator[str]:
+    """Yield sentences of `text`, each ending with its [.!?] run.
+
+    A final unterminated sentence (common in truncated abstracts) is
+    yielded as well. For ASCII text the boundary scan runs as a
+    vectorized NumPy byte comparison instead of per-character regex
+    stepping; non-ASCII input (where byte offsets diverge from character
+    offsets) and environments without NumPy fall back to the compiled
+    iterator. Output matches _SENTENCE_ITER_RE.
+    """
+    np = _numpy()
+    if np is None or not text.isascii():
+        for match in _SENTENCE_ITER_RE.finditer(text):
+            # The $-terminated alternative can match a whitespace-only
+            # tail; punctuated matches always survive the strip
+            if match.group().strip():
+                yield match.group()
+        return
+
+    buf = np.frombuffer(text.encode(), dtype=np.uint8)
+    punct = (buf == 46) | (buf == 33) | (buf == 63)  # . ! ?
+    ends = np.flatnonzero(punct) + 1
+
+    n = len(text)
+    start = 0
+    for end in ends.tolist():
+        # Skip mid-run boundaries so "..." stays one sentence terminator
+        if end < n and punct[end]:
+            continue
+        sentence = text[start:end]
+        # A span of punctuation alone (e.g. a leading "..") is not a sentence
+        if sentence.strip('.!?'):
+            yield sentence
+        start = end
+    # Trailing text with no terminal punctuation is still a sentence
+    tail = text[start:]
+    if tail.strip():
+        yield tail
+
+
+def _filter_methods(names: List[str]) -> List[str]:
+    """Return unique candidate method names, skipping common words.
+
+    Kept as a minimal standalone loop over the regex output so the
+    post-filter work stays out of the match loop and off the dict-building
+    path.
+    """
+    seen = set()
+    unique = []
+    for name in names:
+        # Method names repeat heavily across a batch; interning makes the
+        # set/dict lookups pointer comparisons
+        name = sys.intern(name)
+        if name not in _COMMON_WORDS and name not in seen:
+            seen.add(name)
+            unique.append(name)
+    return unique
+
+
+def _extract_high_level(paper_data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Extract high-level summary from title and abstract.
+
+    MVP Strategy:
+    - main_claim: Use title as primary claim
+    - novelty: Extract first sentence from abstract
+    - contribution: Extract key phrases about methods/results
+
+    TODO: Replace with Claude API for semantic understanding
+    """
+    title = paper_data["title"]
+    abstract = paper_data["abstract"]
+
+    # Main claim is the title
+    main_claim = title.strip()
+
+    # Novelty: extract first meaningful sentence from abstract
+    novelty = "No abstract available"
+    if abstract:
+        # Find first sentence (ending with ., !, or ?)
+        match = _FIRST_SENT_RE.search(abstract)
+        if match:
+            novelty = match.group(1).strip()
+
+    # Contribution: look for method/result keywords, streaming sentence
+    # spans and stopping at the first hit instead of splitting everything
+    contribution = "Not extracted (MVP)"
+    if abstract:
+        for sentence in _sentence_spans(abstract):
+            if _CONTRIB_KW_RE.search(sentence):
+                contribution = sentence.rstrip('.!?').strip()
+                break
+
+    return {
+        "main_claim": main_claim,
+        "novelty": novelty,
+        "contribution": contribution
+    }
+
+
+def _extract_mid_level(paper_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Extract statistics and methods from abstract.
+
+    MVP Strategy:
+    - stats: Pattern match numbers with context (accuracy, AUC, p-value, etc.)
+    - methods: Extract capitalized method names (e.g., "U-Net", "BERT")
+
+    TODO: Claude API for semantic extraction of experimental results
+    """
+    abstract = paper_data["abstract"]
+
+    stats = []
+    methods = []
+
+    if abstract:
+        # Extract statistics in a single fused scan over the abstract
+        # (value-first matches are recognized but not yet emitted)
+        for match in _STATS_RE.finditer(abstract):
+            if match.group('pv'):
+                stats.append({
+                    "type": "p-value",
+                    "metric": "statistical significance",
+                    "value": match.group('pv_val'),
+                    "context": match.group(0),
+                    "page": "abstract"
+                })
+            elif match.group('eq'):
+                value = match.group('eq_v')
+                # Try to parse as float if possible
+                try:
+                    numeric_value = float(value.rstrip('%'))
+                except ValueError:
+                    numeric_value = value
+
+                stats.append({
+                    "type": "performance",
+                    "metric": match.group('eq_m'),
+                    "value": numeric_value,
+                    "context": match.group(0),
+                    "page": "abstract"
+                })
+
+        # Extract methods: Look for capitalized technical terms
+        # Pattern: words with capital letters (excluding start of sentence)
+        for method_name in _filter_methods(_METHOD_RE.findall(abstract)):
+            methods.append({
+                "name": method_name,
+                "parameters": {},  # TODO: extract from full text
+                "page": "abstract"
+            })
+
+    return {
+        "stats": stats,
+        "methods": methods
+    }
+
+
+def _extract_low_level(paper_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Extract quotes from abstract and full text.
+
+    MVP Strategy:
+    - Extract sentences with key findings/claims
+    - Use quoted text or sentences with strong claim words
+
+    TODO: Claude API for extracting salient quotes with context
+    """
+    abstract = paper_data["abstract"]
+
+    quotes = []
+
+    if abstract:
+        # Stream sentence spans and only materialize matching sentences
+        # instead of splitting the whole abstract into a list first
+        for i, sentence in enumerate(_sentence_spans(abstract)):
+            if _CLAIM_KW_RE.search(sentence):
+                quotes.append({
+                    "text": sentence.strip(),
+                    "page": "abstract",
+                    "section": "Abstract",
+                    "context": f"Sentence {i+1} of abstract"
+                })
+
+    return {
+        "quotes": quotes
+    }
+
+
+def _extract_code_methods(paper_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Extract algorithms and equations from full text.
+
+    MVP Strategy:
+    - Mark as TODO since requires full-text processing
+    - Future: Parse LaTeX equations, pseudocode blocks, hyperparameters
+
+    TODO: Implement full-text parsing for code/methods extraction
+    TODO: Claude API for algorithm understanding and equation parsing
+    """
+    # TODO: This requires full_text_markdown processing
+    # For MVP, return empty structures
+
+    return {
+        "algorithms": [],  # TODO: extract from Methods section
+        "equations": [],   # TODO: parse LaTeX equations
+        "hyperparameters": []  # TODO: extract training details
+    }
+
+
+def _store_extraction(paper_id: int, extraction: Dict[str, Any], db_path: str) -> None:
+    """
+    Store extraction results in paper_extractions table.
+
+    Args:
+        paper_id: Database ID of the paper
+        extraction: Hierarchical extraction data
+        db_path: Path to SQLite database
+    """
+    with Database(db_path) as db:
+        # Native UPSERT replaces the old SELECT-then-branch round-trips
+        db.conn.execute(
+            _UPSERT_EXTRACTION_SQL,
+            (
+                paper_id,
+                _dumps(extraction["high_level"]),
+                _dumps(extraction["mid_level"]),
+                _dumps(extraction["low_level"]),
+                _dumps(extraction["code_methods"])
+            )
+        )
+
+        db.conn.commit()
+
+
+def _store_extractions_batch(
+    rows: List[tuple],
+    db_path: str,
+    db: Optional[Database] = None
+) -> None:
+    """
+    Store many extractions in one transaction.
+
+    Args:
+        rows: Tuples of (paper_id, high_level, mid_level, low_level,
+            code_methods) with JSON already serialized
+        db_path: Path to SQLite database
+        db: Optional open Database to reuse instead of opening db_path
+    """
+    if not rows:
+        return
+
+    if db is None:
+        with Database(db_path) as db:
+            _store_extractions_batch(rows, db_path, db=db)
+        return
+
+    # WAL and synchronous=NORMAL are applied by Database itself;
+    # BEGIN IMMEDIATE takes the write lock up front so the batch
+    # never deadlocks upgrading from a read lock mid-transaction.
+    # The isolation level is restored afterwards in case the caller
+    # handed in a shared long-lived connection.
+    prev_isolation = db.conn.isolation_level
+    db.conn.isolation_level = "IMMEDIATE"
+    try:
+        with db.conn:
+            # One upsert per paper inside a single transaction; fsync
+            # cost is amortized over the one commit
+            db.conn.executemany(_UPSERT_EXTRACTION_SQL, rows)
+    finally:
+        db.conn.isolation_level = prev_isolation
+
+
+def extract_multiple_papers(
+    paper_ids: List[int],
+    db_path: str,
+    extraction_depth: str = "full",
+    db: Optional[Database] = None
+) -> Dict[str, Any]:
+    """
+    Extract multiple papers in batch.
+
+    Future Enhancement:
+    - Parallelize extractions using asyncio
+    - Add progress tracking
+    - Batch Claude API calls for efficiency
+
+    Args:
+        paper_ids: List of paper IDs to extract
+        db_path: Path to SQLite database
+        extraction_depth: Extraction depth level
+            - "high_only": Only extract high_level (main_claim, novelty, contribution)
+            - "mid": Extract high_level + mid_level (stats, methods)
+            - "full": Extract all levels (high, mid, low, code_methods)
+        db: Optional open Database to reuse instead of opening db_path
+
+    Returns:
+        Summary of extractions with success/failure counts
+    """
+    results = {
+        "total": len(paper_ids),
+        "successful": 0,
+        "failed": 0,
+        "errors": []
+    }
+
+    # Fetch all papers in one SELECT, extract in memory, then store
+    # everything in a single batched transaction
+    items = _prepare_items(paper_ids, db_path, results, db=db)
+
+    # Extraction is pure regex/dict work with no shared state, so large
+    # batches fan out across cores; small batches skip pool startup
+    # (and the executor import only happens on the batch path)
+    if len(items) > 1:
+        import concurrent.futures
+
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            outcomes = list(executor.map(_extract_one, items, chunksize=16))
+    else:
+        outcomes = [_extract_one(item) for item in items]
+
+    extraction_rows = _rows_from_outcomes(outcomes, extraction_depth, results)
+    _store_extractions_batch(extraction_rows, db_path, db=db)
+
+    return results
+
+
+async def extract_multiple_papers_async(
+    paper_ids: List[int],
+    db_path: str,
+    extraction_depth: str = "full",
+    max_concurrency: int = 10
+) -> Dict[str, Any]:
+    """
+    Async variant of extract_multiple_papers.
+
+    Papers extract concurrently under a bounded semaphore so callers on
+    an event loop (e.g. the MCP server) are not blocked; once Claude API
+    extraction lands, the same structure overlaps the network requests.
+    DB writes still happen in one batched transaction after the gather.
+    """
+    results = {
+        "total": len(paper_ids),
+        "successful": 0,
+        "failed": 0,
+        "errors": []
+    }
+
+    items = await asyncio.to_thread(_prepare_items, paper_ids, db_path, results)
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _extract_bounded(item):
+        async with sem:
+            return await asyncio.to_thread(_extract_one, item)
+
+    outcomes = await asyncio.gather(*(_extract_bounded(item) for item in items))
+
+    extraction_rows = _rows_from_outcomes(outcomes, extraction_depth, results)
+    await asyncio.to_thread(_store_extractions_batch, extraction_rows, db_path)
+
+    return results
+
+
+def _prepare_items(
+    paper_ids: List[int],
+    db_path: str,
+    results: Dict[str, Any],
+    db: Optional[Database] = None
+) -> List[tuple]:
+    """Bulk-fetch papers and pair them with their ids, recording misses."""
+    if db is None and paper_ids:
+        with Database(db_path) as db:
+            return _prepare_items(paper_ids, db_path, results, db=db)
+
+    rows_by_id = {}
+    if paper_ids:
+        placeholders = ",".join("?" * len(paper_ids))
+        cursor = db.conn.execute(
+            f"""SELECT id, title, abstract, full_text_markdown, authors, year, journal
+                FROM papers WHERE id IN ({placeholders})""",
+            paper_ids
+        )
+        rows_by_id = {row["id"]: _paper_data_from_row(row) for row in cursor.fetchall()}
+
+    items = []
+    for paper_id in paper_ids:
+        paper_data = rows_by_id.get(paper_id)
+        if paper_data is None:
+            results["failed"] += 1
+            results["errors"].append({
+                "paper_id": paper_id,
+                "error": f"Paper with ID {paper_id} not found"
+            })
+        else:
+            items.append((paper_id, paper_data))
+    return items
+
+
+def _rows_from_outcomes(
+    outcomes: List[tuple],
+    extraction_depth: str,
+    results: Dict[str, Any]
+) -> List[tuple]:
+    """Serialize successful extraction outcomes into storage rows."""
+    extraction_rows = []
+    for paper_id, extraction, error in outcomes:
+        if error is not None:
+            results["failed"] += 1
+            results["errors"].append({
+                "paper_id": paper_id,
+                "error": error
+            })
+            continue
+
+        result = _apply_extraction_depth(extraction, extraction_depth)
+        extraction_rows.append((
+            paper_id,
+            _dumps(result["high_level"]),
+            _dumps(result["mid_level"]),
+            _dumps(result["low_level"]),
+            _dumps(result["code_methods"])
+        ))
+        results["successful"] += 1
+    return extraction_rows
+
+
+def _extract_one(item) -> tuple:
+    """Picklable per-paper worker: returns (paper_id, extraction, error)."""
+    paper_id, paper_data = item
+    try:
+        return paper_id, _extract_only(paper_data), None
+    except Exception as e:
+        return paper_id, None, str(e)
+
+
+def _apply_extraction_depth(result: Dict[str, Any], extraction_depth: str) -> Dict[str, Any]:
+    """Blank out extraction levels beyond the requested depth."""
+    if extraction_depth == "high_only":
+        return {
+            "high_level": result["high_level"],
+            "mid_level": {},
+            "low_level": {},
+            "code_methods": {}
+        }
+    if extraction_depth == "mid":
+        return {
+            "high_level": result["high_level"],
+            "mid_level": result["mid_level"],
+            "low_level": {},
+            "code_methods": {}
+        }
+    # "full" uses the complete result (no filtering needed)
+    return result
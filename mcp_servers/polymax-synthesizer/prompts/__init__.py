@@ -0,0 +1,73 @@
+"""Prompt templates for Claude API integration (lazily loaded).
+
+Each submodule defines ~10-15 KB of template string literals. PEP 562
+``__getattr__`` defers importing a submodule until one of its names is
+first accessed through the package, so ``import prompts`` — and any code
+path that never touches a given prompt family — pays none of the parse
+and allocation cost. ``from prompts.section_prompts import ...`` keeps
+working unchanged.
+"""
+
+import importlib
+
+_SUBMODULE_EXPORTS = {
+    "extraction_prompts": (
+        "HIGH_LEVEL_PROMPT",
+        "MID_LEVEL_PROMPT",
+        "LOW_LEVEL_PROMPT",
+        "CODE_METHODS_PROMPT",
+        "format_extraction_prompt",
+    ),
+    "section_prompts": (
+        "RESULTS_PROMPT",
+        "METHODS_PROMPT",
+        "DISCUSSION_PROMPT",
+        "INTRODUCTION_PROMPT",
+        "RESULTS_PROMPT_STATIC",
+        "METHODS_PROMPT_STATIC",
+        "DISCUSSION_PROMPT_STATIC",
+        "INTRODUCTION_PROMPT_STATIC",
+        "build_results_prompt",
+        "build_methods_prompt",
+        "build_discussion_prompt",
+        "build_introduction_prompt",
+        "build_cached_section_request",
+        "format_data_for_results_prompt",
+        "format_domain_syntheses_for_discussion",
+        "generate_all_sections",
+        "generate_sections_parallel",
+    ),
+    "prompt_cache": (
+        "PROMPT_MODULES",
+        "build_schema_xml",
+        "export_schema",
+        "module_request",
+    ),
+    "synthesis_prompts": (
+        "build_domain_synthesis_prompt",
+        "build_cross_field_insight_prompt",
+        "build_transfer_learning_prompt",
+        "format_paper_extractions_for_prompt",
+        "synthesize_domains",
+        "synthesize_with_claude",
+    ),
+}
+
+_ATTR_TO_MODULE = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+__all__ = sorted(_ATTR_TO_MODULE)
+
+
+def __getattr__(name):
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache in package globals so later accesses bypass __getattr__
+    globals()[name] = value
+    return value
@@ -32,6 +32,8 @@ Example Output:
     }
 """
 
+import functools
+
 HIGH_LEVEL_PROMPT = """You are a scientific literature analyst. Extract the high-level conceptual content from this paper.
 
 Paper Information:
@@ -239,6 +241,41 @@ Focus on extractable, reusable technical details. Convert math to LaTeX format.
 """
 
 
+_PROMPTS = {
+    "high_level": HIGH_LEVEL_PROMPT,
+    "mid_level": MID_LEVEL_PROMPT,
+    "low_level": LOW_LEVEL_PROMPT,
+    "code_methods": CODE_METHODS_PROMPT
+}
+
+
+_PROMPT_FIELDS = ("title", "abstract", "full_text", "authors", "year", "journal")
+
+
+class _PaperDefaults(dict):
+    """Mapping that lazily supplies defaults for missing prompt fields."""
+
+    _DEFAULTS = {"abstract": "No abstract available", "full_text": ""}
+
+    def __missing__(self, key):
+        return self._DEFAULTS.get(key, "Unknown")
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_cached(level, *field_values):
+    """Format a prompt from scalar fields, memoizing identical inputs.
+
+    Retries and repeated extraction levels re-request the same multi-KB
+    template fill; caching avoids rebuilding the string each time.
+    format_map with a defaulting mapping means only the fields a
+    template actually references are ever looked up.
+    """
+    fields = _PaperDefaults(
+        (k, v) for k, v in zip(_PROMPT_FIELDS, field_values) if v is not None
+    )
+    return _PROMPTS[level].format_map(fields)
+
+
 def format_extraction_prompt(level: str, paper_data: dict) -> str:
     """
     Format an extraction prompt for a given level.
@@ -267,27 +304,12 @@ def format_extraction_prompt(level: str, paper_data: dict) -> str:
         >>> prompt = format_extraction_prompt("high_level", paper)
         >>> # Send prompt to Claude API
     """
-    prompts = {
-        "high_level": HIGH_LEVEL_PROMPT,
-        "mid_level": MID_LEVEL_PROMPT,
-        "low_level": LOW_LEVEL_PROMPT,
-        "code_methods": CODE_METHODS_PROMPT
-    }
-
-    if level not in prompts:
-        raise ValueError(f"Invalid level: {level}. Must be one of {list(prompts.keys())}")
-
-    # Provide defaults for missing fields
-    formatted_data = {
-        "title": paper_data.get("title", "Unknown"),
-        "abstract": paper_data.get("abstract", "No abstract available"),
-        "full_text": paper_data.get("full_text", ""),
-        "authors": paper_data.get("authors", "Unknown"),
-        "year": paper_data.get("year", "Unknown"),
-        "journal": paper_data.get("journal", "Unknown")
-    }
+    if level not in _PROMPTS:
+        raise ValueError(f"Invalid level: {level}. Must be one of {list(_PROMPTS.keys())}")
 
-    return prompts[level].format(**formatted_data)
+    # Scalars keep the cache key hashable; defaults are supplied lazily
+    # by _PaperDefaults for whatever fields are absent
+    return _format_cached(level, *(paper_data.get(k) for k in _PROMPT_FIELDS))
 
 
 # Example usage documentation
@@ -0,0 +1,73 @@
+"""Prompt Cache schema export for self-hosted inference backends.
+
+Anthropic's server-side prompt cache (see build_cached_section_request)
+does not apply when a deployment runs its own model (vLLM / TGI /
+llama.cpp). Those engines can still reuse precomputed KV states for
+stable prompt modules: warm one cache per module at boot, then assemble
+each request as a module reference plus the dynamic tail so attention
+only runs over the per-run data.
+
+This module exports the static section prompts as a Prompt Cache style
+XML schema and assembles module-referencing requests. Wiring the schema
+into a concrete engine (e.g. llama.cpp's --prompt-cache file) is left to
+the deployment.
+"""
+
+import os
+from xml.sax.saxutils import escape
+
+from .section_prompts import (
+    RESULTS_PROMPT_STATIC,
+    METHODS_PROMPT_STATIC,
+    DISCUSSION_PROMPT_STATIC,
+    INTRODUCTION_PROMPT_STATIC,
+)
+
+PROMPT_MODULES = {
+    "results_system": RESULTS_PROMPT_STATIC,
+    "methods_system": METHODS_PROMPT_STATIC,
+    "discussion_system": DISCUSSION_PROMPT_STATIC,
+    "introduction_system": INTRODUCTION_PROMPT_STATIC,
+}
+
+
+def build_schema_xml() -> str:
+    """Render the static prompt modules as a <schema> document."""
+    parts = ['<schema name="polymax-sections">']
+    parts.extend(
+        f'  <module name="{name}">{escape(text)}</module>'
+        for name, text in PROMPT_MODULES.items()
+    )
+    parts.append('</schema>')
+    return "\n".join(parts)
+
+
+def export_schema(path) -> str:
+    """Write the schema XML atomically and return the path written.
+
+    Run this at server boot so the inference backend can precompute one
+    KV cache per module before the first request arrives.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(build_schema_xml())
+    os.replace(tmp, path)
+    return str(path)
+
+
+def module_request(module_name: str, dynamic_tail: str) -> str:
+    """Assemble a request that reuses a cached module's KV states.
+
+    Args:
+        module_name: One of the PROMPT_MODULES keys
+        dynamic_tail: Per-run data (e.g. results_prompt_dynamic(...))
+
+    Returns:
+        Request text referencing the cached module
+    """
+    if module_name not in PROMPT_MODULES:
+        raise ValueError(
+            f"Unknown prompt module: {module_name}. "
+            f"Must be one of {list(PROMPT_MODULES)}"
+        )
+    return f'<module ref="{module_name}"/>\n{dynamic_tail}'
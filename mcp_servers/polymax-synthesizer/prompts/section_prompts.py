@@ -8,7 +8,34 @@ Future Enhancement:
 - Replace template-based generation with LLM-powered prose
 """
 
-RESULTS_PROMPT = """You are writing the Results section of a scientific manuscript.
+import asyncio
+import json
+
+from llm_cache import cached_claude
+
+# Each prompt is split into a large static prefix (identical on every
+# call, so it can be sent with cache_control and served from Anthropic's
+# prompt cache) and a small dynamic tail carrying the per-run data.
+# The tails are built by f-string functions rather than str.format() on
+# the multi-KB templates, which also lets the static bodies use plain
+# LaTeX braces instead of {{...}} escapes. The combined *_PROMPT
+# constants remain for callers that want the full template text.
+
+# Rules shared verbatim by all four section prompts. Keeping this block
+# textually identical and in the same position across prompts maximizes
+# the shared prefix when the static parts are sent with cache_control.
+_COMMON_PROMPT_RULES = """
+### LaTeX Formatting (all sections)
+- Use **non-breaking spaces** before cross-references: `Table~\\ref{tab:results}`, `Figure~\\ref{fig:results}`, `Equation~\\ref{eq:loss}`
+- Use `\\ref{}` for cross-references; reference YOUR tables/figures, not generic ones
+- Cite literature in natural language with PMID when available
+
+### Important Notes (all sections)
+- **Professional tone**: Concise, factual, third-person academic prose
+- **Specificity**: Use exact statistics and citations, never vague statements
+"""
+
+RESULTS_PROMPT_STATIC = """You are writing the Results section of a scientific manuscript.
 
 ## Context
 
@@ -17,23 +44,13 @@ You have experimental data from tables and figures. Your task is to write a Resu
 2. Cites table/figure references properly
 3. Uses professional LaTeX formatting
 
-## Your Data
-
-{data_summary}
-
 ## Requirements
 
 ### Data Grounding
-- **Cite exact values**: "SSIM improved from 0.193 to 0.605 (Table~\\ref{{tab:results}})"
+- **Cite exact values**: "SSIM improved from 0.193 to 0.605 (Table~\\ref{tab:results})"
 - **Never round**: Use exact values from tables (0.605, not 0.6 or "approximately 0.6")
 - **Constraint checking**: All cited values must match the provided data exactly
 
-### LaTeX Formatting
-- Use **non-breaking spaces** before citations: `Table~\\ref{{tab:results}}` NOT `Table \\ref{{tab:results}}`
-- Use **non-breaking spaces** before citations: `Figure~\\ref{{fig:results}}` NOT `Figure \\ref{{fig:results}}`
-- Reference YOUR figures/tables, not generic ones
-- Use `\\ref{{}}` for cross-references
-
 ### Structure
 1. **Opening statement**: Briefly state what was evaluated
 2. **Key findings**: Present main results with exact values and citations
@@ -43,39 +60,51 @@ You have experimental data from tables and figures. Your task is to write a Resu
 ### Example Output
 
 ```latex
-\\section{{Results}}
+\\section{Results}
 
 We evaluated our approach on spatial transcriptomics prediction from H\\&E images.
 
-\\subsection{{Poisson Loss Improves Sparsity Handling}}
+\\subsection{Poisson Loss Improves Sparsity Handling}
 
-Poisson loss significantly outperformed MSE loss across all metrics. SSIM improved from 0.193 (MSE) to 0.605 (Poisson), representing a 213\\% relative improvement (Table~\\ref{{tab:results}}). Similarly, PCC increased from 0.147 to 0.489 (233\\% improvement).
+Poisson loss significantly outperformed MSE loss across all metrics. SSIM improved from 0.193 (MSE) to 0.605 (Poisson), representing a 213\\% relative improvement (Table~\\ref{tab:results}). Similarly, PCC increased from 0.147 to 0.489 (233\\% improvement).
 
-Gene-level analysis revealed that Poisson loss particularly benefits sparse genes. For genes with expression in fewer than 10\\% of spots, SSIM improved by 312\\% on average (Figure~\\ref{{fig:sparse_genes}}).
+Gene-level analysis revealed that Poisson loss particularly benefits sparse genes. For genes with expression in fewer than 10\\% of spots, SSIM improved by 312\\% on average (Figure~\\ref{fig:sparse_genes}).
 
-\\subsection{{Performance Across Tissue Types}}
+\\subsection{Performance Across Tissue Types}
 
-Table~\\ref{{tab:tissue_types}} summarizes results across different tissue regions. Tumor regions showed the strongest improvement (SSIM: 0.612), followed by stroma (SSIM: 0.598) and necrotic regions (SSIM: 0.543).
+Table~\\ref{tab:tissue_types} summarizes results across different tissue regions. Tumor regions showed the strongest improvement (SSIM: 0.612), followed by stroma (SSIM: 0.598) and necrotic regions (SSIM: 0.543).
 ```
 
 ### Important Notes
 - **No speculation**: Only report what the data shows
 - **No interpretation**: Save discussion for Discussion section
-- **Exact citations**: Always include `Table~\\ref{{}}` or `Figure~\\ref{{}}`
-- **Professional tone**: Concise, factual, third-person
+- **Exact citations**: Always include `Table~\\ref{}` or `Figure~\\ref{}`
+""" + _COMMON_PROMPT_RULES
+
+def results_prompt_dynamic(data_summary: str) -> str:
+    """Dynamic tail of the Results prompt — the only part that varies per run."""
+    return f"""
+## Your Data
+
+{data_summary}
 
 Now generate the Results section based on the provided data.
 """
 
-METHODS_PROMPT = """You are writing the Methods section of a scientific manuscript.
 
-## Context
+def build_results_prompt(data_summary: str) -> str:
+    """Assemble the full Results prompt."""
+    return RESULTS_PROMPT_STATIC + results_prompt_dynamic(data_summary)
 
-You need to describe the experimental approach, algorithms, and statistical methods used in this work.
 
-## Your Implementation Details
+RESULTS_PROMPT_DYNAMIC_TEMPLATE = results_prompt_dynamic("{data_summary}")
+RESULTS_PROMPT = RESULTS_PROMPT_STATIC + RESULTS_PROMPT_DYNAMIC_TEMPLATE
 
-{methods_summary}
+METHODS_PROMPT_STATIC = """You are writing the Methods section of a scientific manuscript.
+
+## Context
+
+You need to describe the experimental approach, algorithms, and statistical methods used in this work.
 
 ## Requirements
 
@@ -87,51 +116,50 @@ You need to describe the experimental approach, algorithms, and statistical meth
 5. **Evaluation metrics**: How performance was measured
 
 ### LaTeX Formatting
-- Use `\\texttt{{}}` for code/software names: `\\texttt{{PyTorch}}`
+- Use `\\texttt{}` for code/software names: `\\texttt{PyTorch}`
 - Use mathematical notation for equations: `$L = -\\log P(y|x)$`
 - Use algorithmic environments if describing algorithms
-- Non-breaking spaces before equation references: `Equation~\\ref{{eq:loss}}`
 
 ### Example Output
 
 ```latex
-\\section{{Methods}}
+\\section{Methods}
 
-\\subsection{{Dataset}}
+\\subsection{Dataset}
 
 We used Visium HD spatial transcriptomics data from 12 colorectal cancer samples, paired with H\\&E histology images. Each sample contained 50,000-100,000 spots at 2μm resolution with gene expression measurements for 18,000 genes.
 
-\\subsection{{Model Architecture}}
+\\subsection{Model Architecture}
 
-Our approach uses a vision transformer encoder (\\texttt{{Virchow2}}) to extract 256-dimensional features from each 2μm patch. Features are processed through a spatial context module with 3 graph attention layers, followed by a gene expression decoder.
+Our approach uses a vision transformer encoder (\\texttt{Virchow2}) to extract 256-dimensional features from each 2μm patch. Features are processed through a spatial context module with 3 graph attention layers, followed by a gene expression decoder.
 
-\\subsection{{Loss Function}}
+\\subsection{Loss Function}
 
 We compared two loss functions for sparse gene expression prediction:
-\\begin{{equation}}
-L_{{MSE}} = \\frac{{1}}{{N}}\\sum_{{i=1}}^{{N}}(y_i - \\hat{{y}}_i)^2
-\\label{{eq:mse}}
-\\end{{equation}}
+\\begin{equation}
+L_{MSE} = \\frac{1}{N}\\sum_{i=1}^{N}(y_i - \\hat{y}_i)^2
+\\label{eq:mse}
+\\end{equation}
 
-\\begin{{equation}}
-L_{{Poisson}} = -\\sum_{{i=1}}^{{N}}\\left[y_i\\log(\\hat{{y}}_i) - \\hat{{y}}_i\\right]
-\\label{{eq:poisson}}
-\\end{{equation}}
+\\begin{equation}
+L_{Poisson} = -\\sum_{i=1}^{N}\\left[y_i\\log(\\hat{y}_i) - \\hat{y}_i\\right]
+\\label{eq:poisson}
+\\end{equation}
 
-where $y_i$ is the true count and $\\hat{{y}}_i$ is the predicted count.
+where $y_i$ is the true count and $\\hat{y}_i$ is the predicted count.
 
-\\subsection{{Training}}
+\\subsection{Training}
 
-Models were trained using Adam optimizer with learning rate $10^{{-4}}$ for 100 epochs. We used 80/10/10 train/validation/test splits at the sample level.
+Models were trained using Adam optimizer with learning rate $10^{-4}$ for 100 epochs. We used 80/10/10 train/validation/test splits at the sample level.
 
-\\subsection{{Evaluation Metrics}}
+\\subsection{Evaluation Metrics}
 
 Performance was measured using:
-\\begin{{itemize}}
+\\begin{itemize}
 \\item Structural Similarity Index (SSIM)
 \\item Pearson Correlation Coefficient (PCC)
 \\item Mean Absolute Error (MAE)
-\\end{{itemize}}
+\\end{itemize}
 ```
 
 ### Important Notes
@@ -139,23 +167,32 @@ Performance was measured using:
 - **Justification**: Briefly explain key design choices
 - **Standard practices**: Reference established methods when appropriate
 - **No results**: Save performance numbers for Results section
+""" + _COMMON_PROMPT_RULES
+
+def methods_prompt_dynamic(methods_summary: str) -> str:
+    """Dynamic tail of the Methods prompt."""
+    return f"""
+## Your Implementation Details
+
+{methods_summary}
 
 Now generate the Methods section based on the provided implementation details.
 """
 
-DISCUSSION_PROMPT = """You are writing the Discussion section of a scientific manuscript.
 
-## Context
+def build_methods_prompt(methods_summary: str) -> str:
+    """Assemble the full Methods prompt."""
+    return METHODS_PROMPT_STATIC + methods_prompt_dynamic(methods_summary)
 
-Synthesize your experimental results with literature findings to provide insights and identify future directions.
 
-## Your Results
+METHODS_PROMPT_DYNAMIC_TEMPLATE = methods_prompt_dynamic("{methods_summary}")
+METHODS_PROMPT = METHODS_PROMPT_STATIC + METHODS_PROMPT_DYNAMIC_TEMPLATE
 
-{results_summary}
+DISCUSSION_PROMPT_STATIC = """You are writing the Discussion section of a scientific manuscript.
 
-## Literature Syntheses
+## Context
 
-{domain_syntheses}
+Synthesize your experimental results with literature findings to provide insights and identify future directions.
 
 ## Requirements
 
@@ -172,31 +209,26 @@ Synthesize your experimental results with literature findings to provide insight
 - **Transfer methods**: "Negative binomial approaches that improved neural modeling by 30\\% (PMID: 25678901) could address overdispersion in our spatial data"
 - **Explain transferability**: Why similar data structures enable method transfer
 
-### LaTeX Formatting
-- Non-breaking spaces: `Figure~\\ref{{fig:results}}`
-- Citations to literature: Use natural language + PMID when available
-- Professional tone: Balanced, not overclaiming
-
 ### Example Output
 
 ```latex
-\\section{{Discussion}}
+\\section{Discussion}
 
-Our results demonstrate that Poisson loss substantially improves spatial gene expression prediction from histology, achieving 213\\% SSIM improvement over MSE loss (Table~\\ref{{tab:results}}). This finding aligns with established principles from spike train modeling, where Poisson assumptions better capture sparse binary events (Pillow et al., 2008, PMID: 18563015).
+Our results demonstrate that Poisson loss substantially improves spatial gene expression prediction from histology, achieving 213\\% SSIM improvement over MSE loss (Table~\\ref{tab:results}). This finding aligns with established principles from spike train modeling, where Poisson assumptions better capture sparse binary events (Pillow et al., 2008, PMID: 18563015).
 
-\\subsection{{Why Poisson Loss Works for Sparse Data}}
+\\subsection{Why Poisson Loss Works for Sparse Data}
 
 The success of Poisson loss stems from its natural handling of count data statistics. Unlike MSE, which treats all prediction errors equally, Poisson loss accounts for the variance-mean relationship in count data. At 2μm resolution, 90\\% of genes show zero expression in most spots—a sparsity pattern nearly identical to neural spike trains (Pillow et al., 2008).
 
-\\subsection{{Cross-Field Transfer Opportunities}}
+\\subsection{Cross-Field Transfer Opportunities}
 
 Our findings suggest broader applicability beyond spatial transcriptomics:
 
-\\textbf{{Single-cell RNA-seq}}: Similar sparsity patterns (70-90\\% zeros) suggest Poisson-based decoders could improve imputation methods.
+\\textbf{Single-cell RNA-seq}: Similar sparsity patterns (70-90\\% zeros) suggest Poisson-based decoders could improve imputation methods.
 
-\\textbf{{Digital pathology}}: Rare cell detection shares statistical structure with sparse gene detection. Methods from this work could enhance cell counting algorithms.
+\\textbf{Digital pathology}: Rare cell detection shares statistical structure with sparse gene detection. Methods from this work could enhance cell counting algorithms.
 
-\\subsection{{Limitations and Future Work}}
+\\subsection{Limitations and Future Work}
 
 While Poisson loss addresses sparsity, it assumes variance equals the mean—an assumption that may fail for overdispersed genes. Literature on spike train modeling shows negative binomial models improve performance by 15-30\\% when overdispersion is present (Gao et al., 2015, PMID: 25678901). Future work should evaluate NB2 loss for spatial transcriptomics.
 
@@ -205,26 +237,42 @@ Additionally, our evaluation used Visium HD data at 2μm resolution. Transferabi
 
 ### Important Notes
 - **Balance**: Acknowledge limitations while highlighting contributions
-- **Specificity**: Use exact statistics and citations
 - **Forward-looking**: Identify concrete next steps
 - **Cross-domain**: Actively connect to other fields
+""" + _COMMON_PROMPT_RULES
+
+def discussion_prompt_dynamic(results_summary: str, domain_syntheses: str) -> str:
+    """Dynamic tail of the Discussion prompt."""
+    return f"""
+## Your Results
+
+{results_summary}
+
+## Literature Syntheses
+
+{domain_syntheses}
 
 Now generate the Discussion section based on your results and literature syntheses.
 """
 
-INTRODUCTION_PROMPT = """You are writing the Introduction section of a scientific manuscript.
 
-## Context
+def build_discussion_prompt(results_summary: str, domain_syntheses: str) -> str:
+    """Assemble the full Discussion prompt."""
+    return DISCUSSION_PROMPT_STATIC + discussion_prompt_dynamic(
+        results_summary, domain_syntheses
+    )
 
-Motivate the research problem and clearly state your contribution.
 
-## Background
+DISCUSSION_PROMPT_DYNAMIC_TEMPLATE = discussion_prompt_dynamic(
+    "{results_summary}", "{domain_syntheses}"
+)
+DISCUSSION_PROMPT = DISCUSSION_PROMPT_STATIC + DISCUSSION_PROMPT_DYNAMIC_TEMPLATE
 
-{domain_context}
+INTRODUCTION_PROMPT_STATIC = """You are writing the Introduction section of a scientific manuscript.
 
-## Your Contribution
+## Context
 
-{contribution_summary}
+Motivate the research problem and clearly state your contribution.
 
 ## Requirements
 
@@ -235,15 +283,13 @@ Motivate the research problem and clearly state your contribution.
 4. **Key results preview** (1 paragraph): High-level summary of main finding
 5. **Paper organization** (optional): Roadmap of sections
 
-### LaTeX Formatting
-- Non-breaking spaces before citations
-- Professional academic tone
+### Style
 - Logical flow from general to specific
 
 ### Example Output
 
 ```latex
-\\section{{Introduction}}
+\\section{Introduction}
 
 Spatial transcriptomics technologies enable measurement of gene expression with spatial context, revolutionizing our understanding of tissue architecture and cellular interactions. However, current platforms face a fundamental trade-off: high spatial resolution (e.g., 2μm) produces extremely sparse gene expression data, while lower resolution (10-100μm) averages signal across multiple cells, obscuring spatial heterogeneity.
 
@@ -261,11 +307,64 @@ The remainder of this paper describes our methods (Section 2), experimental resu
 - **Clear contribution**: Explicitly state what's new
 - **Accessible**: Readable by researchers outside narrow specialty
 - **Forward references**: Point to later sections naturally
+""" + _COMMON_PROMPT_RULES
+
+def introduction_prompt_dynamic(domain_context: str, contribution_summary: str) -> str:
+    """Dynamic tail of the Introduction prompt."""
+    return f"""
+## Background
+
+{domain_context}
+
+## Your Contribution
+
+{contribution_summary}
 
 Now generate the Introduction section based on the provided context.
 """
 
 
+def build_introduction_prompt(domain_context: str, contribution_summary: str) -> str:
+    """Assemble the full Introduction prompt."""
+    return INTRODUCTION_PROMPT_STATIC + introduction_prompt_dynamic(
+        domain_context, contribution_summary
+    )
+
+
+INTRODUCTION_PROMPT_DYNAMIC_TEMPLATE = introduction_prompt_dynamic(
+    "{domain_context}", "{contribution_summary}"
+)
+INTRODUCTION_PROMPT = INTRODUCTION_PROMPT_STATIC + INTRODUCTION_PROMPT_DYNAMIC_TEMPLATE
+
+
+def build_cached_section_request(static_prompt: str, dynamic_tail: str) -> dict:
+    """
+    Shape a section-generation request for Anthropic prompt caching.
+
+    The invariant prompt body goes into a system block marked with
+    cache_control so every call after the first in a cache window pays
+    cached-token pricing for it; only the small dynamic tail rides in
+    the user message.
+
+    Args:
+        static_prompt: One of the *_PROMPT_STATIC constants
+        dynamic_tail: The filled *_PROMPT_DYNAMIC_TEMPLATE for this run
+
+    Returns:
+        Dict of keyword arguments for client.messages.create
+    """
+    return {
+        "system": [
+            {
+                "type": "text",
+                "text": static_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }
+        ],
+        "messages": [{"role": "user", "content": dynamic_tail}]
+    }
+
+
 def format_data_for_results_prompt(main_finding: dict) -> str:
     """
     Format experimental data for Results section prompt.
@@ -276,37 +375,42 @@ def format_data_for_results_prompt(main_finding: dict) -> str:
     Returns:
         Formatted string for prompt
     """
-    formatted = []
+    lines = []
 
     # Key findings
     if "key_findings" in main_finding:
-        formatted.append("### Key Findings")
+        lines.append("### Key Findings")
         for finding in main_finding["key_findings"]:
-            claim = finding.get("claim", "")
-            evidence = finding.get("evidence", "")
+            claim = finding.get("claim") or ""
+            evidence = finding.get("evidence") or ""
             value = finding.get("value")
-            formatted.append(f"- {claim}")
+            entry = f"- {claim}"
             if evidence:
-                formatted.append(f"  Evidence: {evidence}")
+                entry += f"\n  Evidence: {evidence}"
             if value is not None:
-                formatted.append(f"  Value: {value}")
-        formatted.append("")
+                entry += f"\n  Value: {value}"
+            lines.append(entry)
+        lines.append("")
 
     # Tables
     if "tables" in main_finding:
-        formatted.append("### Available Tables")
-        for table in main_finding["tables"]:
-            formatted.append(f"- {table.get('name', 'Table')}: {table.get('path', '')}")
-        formatted.append("")
+        lines.append("### Available Tables")
+        lines.extend(
+            f"- {table.get('name') or 'Table'}: {table.get('path') or ''}"
+            for table in main_finding["tables"]
+        )
+        lines.append("")
 
     # Figures
     if "figures" in main_finding:
-        formatted.append("### Available Figures")
-        for figure in main_finding["figures"]:
-            formatted.append(f"- {figure.get('name', 'Figure')}: {figure.get('path', '')}")
-        formatted.append("")
+        lines.append("### Available Figures")
+        lines.extend(
+            f"- {figure.get('name') or 'Figure'}: {figure.get('path') or ''}"
+            for figure in main_finding["figures"]
+        )
+        lines.append("")
 
-    return "\n".join(formatted)
+    return "\n".join(lines)
 
 
 def format_domain_syntheses_for_discussion(domain_syntheses: list) -> str:
@@ -319,17 +423,137 @@ def format_domain_syntheses_for_discussion(domain_syntheses: list) -> str:
     Returns:
         Formatted string for prompt
     """
-    formatted = []
+    # One f-string per synthesis, one join over the generator — no
+    # intermediate list or per-entry append calls
+    return "\n".join(
+        f"### {s.get('name', 'Unknown')}\n{s.get('summary_markdown', '')}\n"
+        for s in domain_syntheses
+    )
+
+
+_SECTION_KEYS = ("results", "methods", "discussion", "introduction")
+
+_BATCH_HEADER = """You are writing the four main sections of a scientific manuscript in one pass.
+Each section has its own instructions and data below, separated by '=== <SECTION> ===' markers.
+Ignore any per-section instruction to generate only that section; instead return ALL four
+sections together as a single fenced JSON object:
+
+```json
+{"results": "<LaTeX>", "methods": "<LaTeX>", "discussion": "<LaTeX>", "introduction": "<LaTeX>"}
+```
+"""
+
+
+def _section_prompts(
+    main_finding: dict,
+    methods_summary: str,
+    results_summary: str,
+    domain_syntheses: list
+) -> dict:
+    """Build the four per-section prompts from shared manuscript inputs."""
+    data_summary = format_data_for_results_prompt(main_finding)
+    syntheses_text = format_domain_syntheses_for_discussion(domain_syntheses)
+    return {
+        "results": build_results_prompt(data_summary),
+        "methods": build_methods_prompt(methods_summary),
+        "discussion": build_discussion_prompt(results_summary, syntheses_text),
+        "introduction": build_introduction_prompt(syntheses_text, data_summary)
+    }
+
+
+def _parse_sections_json(text: str) -> dict:
+    """Extract the fenced JSON object of sections from a model response."""
+    if "```" in text:
+        body = text.split("```", 2)[1]
+        # Drop an optional language tag on the opening fence
+        if "\n" in body:
+            first, rest = body.split("\n", 1)
+            if first.strip().isalpha():
+                body = rest
+        text = body
+    return json.loads(text)
+
+
+@cached_claude(ttl_seconds=86400)
+def generate_all_sections(
+    main_finding: dict,
+    methods_summary: str,
+    results_summary: str,
+    domain_syntheses: list,
+    api_key: str
+) -> dict:
+    """
+    Generate all four manuscript sections in a single Claude request.
+
+    Results are cached on disk by input hash for a day (see llm_cache),
+    so regenerating an unchanged manuscript skips the API entirely.
+
+    The sections are independent, so issuing one request for all of them
+    cuts round-trips from 4 to 1 and shares the manuscript context once
+    instead of repeating it per call.
+
+    Args:
+        main_finding: Experimental data dictionary
+        methods_summary: Description of the experimental approach
+        results_summary: Summary of experimental results
+        domain_syntheses: List of domain synthesis records
+        api_key: Anthropic API key
+
+    Returns:
+        Dict with "results", "methods", "discussion", "introduction" LaTeX strings
+    """
+    from anthropic import Anthropic
+
+    prompts = _section_prompts(
+        main_finding, methods_summary, results_summary, domain_syntheses
+    )
+    prompt = _BATCH_HEADER + "\n" + "\n\n".join(
+        f"=== {key.upper()} ===\n\n{prompts[key]}" for key in _SECTION_KEYS
+    )
+
+    client = Anthropic(api_key=api_key)
+    response = client.messages.create(
+        model="claude-opus-4-5-20251101",
+        max_tokens=16384,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    return _parse_sections_json(response.content[0].text)
+
+
+async def generate_sections_parallel(
+    main_finding: dict,
+    methods_summary: str,
+    results_summary: str,
+    domain_syntheses: list,
+    api_key: str
+) -> dict:
+    """
+    Generate the four sections as parallel per-section requests.
 
-    for synthesis in domain_syntheses:
-        domain_name = synthesis.get("name", "Unknown")
-        summary = synthesis.get("summary_markdown", "")
+    Fallback for callers that want one response per section (e.g. to
+    stream or retry sections independently): the four requests fire
+    concurrently via asyncio.gather instead of serially.
 
-        formatted.append(f"### {domain_name}")
-        formatted.append(summary)
-        formatted.append("")
+    Returns:
+        Dict with "results", "methods", "discussion", "introduction" LaTeX strings
+    """
+    from anthropic import AsyncAnthropic
 
-    return "\n".join(formatted)
+    prompts = _section_prompts(
+        main_finding, methods_summary, results_summary, domain_syntheses
+    )
+    client = AsyncAnthropic(api_key=api_key)
+
+    async def _one(prompt: str) -> str:
+        response = await client.messages.create(
+            model="claude-opus-4-5-20251101",
+            max_tokens=4096,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.content[0].text
+
+    texts = await asyncio.gather(*(_one(prompts[key]) for key in _SECTION_KEYS))
+    return dict(zip(_SECTION_KEYS, texts))
 
 
 # Example usage comments for future Claude API integration
@@ -337,7 +561,9 @@ def format_domain_syntheses_for_discussion(domain_syntheses: list) -> str:
 # Future integration with Claude Opus 4.5
 
 from anthropic import Anthropic
+from llm_cache import cached_claude
 
+@cached_claude(ttl_seconds=86400)
 def generate_results_section(main_finding: dict, api_key: str) -> str:
     '''
     Generate Results section using Claude Opus 4.5 API.
@@ -354,16 +580,18 @@ def generate_results_section(main_finding: dict, api_key: str) -> str:
     # Format data for prompt
     data_summary = format_data_for_results_prompt(main_finding)
 
-    # Generate prompt
-    prompt = RESULTS_PROMPT.format(data_summary=data_summary)
+    # Static prefix goes in a cache_control system block so repeated
+    # section generations only pay full price for the dynamic tail
+    request = build_cached_section_request(
+        RESULTS_PROMPT_STATIC,
+        results_prompt_dynamic(data_summary)
+    )
 
     # Call Claude Opus 4.5
     response = client.messages.create(
         model="claude-opus-4-5-20251101",
         max_tokens=4096,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
+        **request
     )
 
     return response.content[0].text
@@ -390,19 +618,17 @@ def generate_discussion_section(
     # Format domain syntheses
     syntheses_text = format_domain_syntheses_for_discussion(domain_syntheses)
 
-    # Generate prompt
-    prompt = DISCUSSION_PROMPT.format(
-        results_summary=results_summary,
-        domain_syntheses=syntheses_text
+    # Same split: cached static prefix, per-run dynamic tail
+    request = build_cached_section_request(
+        DISCUSSION_PROMPT_STATIC,
+        discussion_prompt_dynamic(results_summary, syntheses_text)
     )
 
     # Call Claude Opus 4.5
     response = client.messages.create(
         model="claude-opus-4-5-20251101",
         max_tokens=4096,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
+        **request
     )
 
     return response.content[0].text
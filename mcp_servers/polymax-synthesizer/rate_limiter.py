@@ -0,0 +1,43 @@
+"""Shared token-bucket rate limiting for asyncio callers."""
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter usable as an async context manager.
+
+    Allows max_rate acquisitions per time_period seconds, with tokens
+    refilled continuously, so bursts drain the bucket and sustained
+    load settles at the configured rate instead of hammering a
+    downstream service into 429s. acquire() sleeps until a token is
+    available; the lock keeps waiters FIFO-fair.
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        self._capacity = float(max_rate)
+        self._tokens = float(max_rate)
+        self._rate = max_rate / time_period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until the bucket refills if empty."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
@@ -1,12 +1,126 @@
 """Repository analysis for mode detection."""
+import functools
 import json
+import mmap
+import os
+import re
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+DOMAIN_KEYWORDS = {
+    "spatial-transcriptomics": ["spatial transcriptomics", "visium"],
+    "loss-functions": ["loss function", "mse", "poisson"],
+    "deep-learning": ["deep learning", "neural network"],
+    "computational-pathology": ["pathology", "histology"]
+}
+
+# One case-insensitive alternation scans the README once instead of one
+# substring pass per keyword; group names map back to domain slugs.
+# Compiled in bytes mode so an mmap'd file can be searched directly —
+# all keywords are ASCII, so bytes-level IGNORECASE is sufficient.
+_DOMAIN_RE_BYTES = re.compile(
+    "|".join(
+        f"(?P<{domain.replace('-', '_')}>{'|'.join(re.escape(kw) for kw in keywords)})"
+        for domain, keywords in DOMAIN_KEYWORDS.items()
+    ).encode("ascii"),
+    re.IGNORECASE
+)
+
+# Optional Aho-Corasick fast path: one trie scan for all keywords at
+# once, O(N + matches) regardless of keyword count. Worth it if the
+# keyword table ever grows large; the regex alternation stays the
+# default when pyahocorasick isn't installed.
+if ahocorasick is not None:
+    _DOMAIN_AUTOMATON = ahocorasick.Automaton()
+    for _domain, _keywords in DOMAIN_KEYWORDS.items():
+        for _kw in _keywords:
+            _DOMAIN_AUTOMATON.add_word(_kw, _domain)
+    _DOMAIN_AUTOMATON.make_automaton()
+else:
+    _DOMAIN_AUTOMATON = None
+
+
+def _detect_domains(readme_path) -> list:
+    """Detect domains by scanning the README once.
+
+    With pyahocorasick installed, a single trie pass covers every
+    keyword. Otherwise the bytes-mode regex searches an mmap of the
+    file — no UTF-8 decode, no whole-file str — and stops as soon as
+    every domain has matched.
+    """
+    if _DOMAIN_AUTOMATON is not None:
+        text = Path(readme_path).read_text(encoding="utf-8", errors="replace").lower()
+        found = {domain for _, domain in _DOMAIN_AUTOMATON.iter(text)}
+        return [domain for domain in DOMAIN_KEYWORDS if domain in found]
+
+    hits = set()
+    try:
+        with open(readme_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in _DOMAIN_RE_BYTES.finditer(mm):
+                    hits.add(match.lastgroup)
+                    if len(hits) == len(DOMAIN_KEYWORDS):
+                        break
+    except ValueError:
+        # Empty files cannot be mapped; nothing to detect either way
+        pass
+    return [
+        domain for domain in DOMAIN_KEYWORDS
+        if domain.replace('-', '_') in hits
+    ]
+
+
+def _scan_suffix(directory, suffix):
+    """List names of files with the given suffix, or None if the directory is missing.
+
+    One scandir pass reads names and file types together; catching
+    FileNotFoundError replaces a separate .exists() stat on the directory.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                e.name for e in entries
+                if e.name.endswith(suffix) and e.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return None
+
+
+def _mtime_ns(path) -> int:
+    """st_mtime_ns of a path, or -1 if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _cache_key(repo: Path) -> tuple:
+    """Cheap change stamp for a repo: mtimes of the three inputs we read."""
+    return (
+        _mtime_ns(repo / "README.md"),
+        _mtime_ns(repo / "tables"),
+        _mtime_ns(repo / "figures")
+    )
+
+
 def analyze_repository(repo_path: str) -> Dict[str, Any]:
     """
     Analyze repository structure and detect operating mode.
 
+    Results are memoized per (path, mtime stamps), so repeated MCP calls
+    against an unchanged repo cost three stats instead of a directory
+    walk plus a README read.
+
     Returns:
         {
             "detected_mode": "primary_research" | "review",
@@ -14,38 +128,29 @@ def analyze_repository(repo_path: str) -> Dict[str, Any]:
             "detected_domains": [...]
         }
     """
-    repo = Path(repo_path)
+    repo_path = str(repo_path)
+    return _analyze_cached(repo_path, _cache_key(Path(repo_path)))
 
-    # Check for results data
-    has_tables = (repo / "tables").exists()
-    has_figures = (repo / "figures").exists()
-    has_readme = (repo / "README.md").exists()
 
-    tables = []
-    if has_tables:
-        tables = [f.name for f in (repo / "tables").glob("*.csv")]
+@functools.lru_cache(maxsize=32)
+def _analyze_cached(repo_path: str, stamps: tuple) -> Dict[str, Any]:
+    repo = Path(repo_path)
 
-    figures = []
-    if has_figures:
-        figures = [f.name for f in (repo / "figures").glob("*.png")]
+    # Check for results data (None distinguishes missing dir from empty dir)
+    tables = _scan_suffix(repo / "tables", ".csv")
+    figures = _scan_suffix(repo / "figures", ".png")
+    has_tables = tables is not None
+    has_figures = figures is not None
+    has_readme = os.path.isfile(repo / "README.md")
+    tables = tables or []
+    figures = figures or []
 
     # Detect mode
     has_results = has_tables and has_figures and len(tables) > 0
     detected_mode = "primary_research" if has_results else "review"
 
     # Simple domain detection from README
-    detected_domains = []
-    if has_readme:
-        readme_text = (repo / "README.md").read_text().lower()
-        domain_keywords = {
-            "spatial-transcriptomics": ["spatial transcriptomics", "visium"],
-            "loss-functions": ["loss function", "mse", "poisson"],
-            "deep-learning": ["deep learning", "neural network"],
-            "computational-pathology": ["pathology", "histology"]
-        }
-        for domain, keywords in domain_keywords.items():
-            if any(kw in readme_text for kw in keywords):
-                detected_domains.append(domain)
+    detected_domains = _detect_domains(repo / "README.md") if has_readme else []
 
     return {
         "detected_mode": detected_mode,
@@ -57,3 +162,16 @@ def analyze_repository(repo_path: str) -> Dict[str, Any]:
         },
         "detected_domains": detected_domains
     }
+
+
+def analyze_repository_json(repo_path: str) -> bytes:
+    """Analyze a repository and return the result pre-serialized as JSON.
+
+    Handlers that ship the analysis straight into a response can use
+    this to skip a second json.dumps pass; orjson serializes the nested
+    list-of-str payload severalfold faster when available.
+    """
+    result = analyze_repository(repo_path)
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps(result).encode("utf-8")
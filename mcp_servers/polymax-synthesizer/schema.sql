@@ -48,12 +48,13 @@ CREATE TABLE IF NOT EXISTS paper_extractions (
     mid_level TEXT,   -- JSON: {stats, methods}
     low_level TEXT,   -- JSON: {quotes}
     code_methods TEXT,  -- JSON: {algorithms, equations, hyperparameters}
-    extraction_model TEXT DEFAULT 'claude-opus-4-5-20251101',
+    extraction_model TEXT DEFAULT 'rule-based-mvp',
     extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (paper_id) REFERENCES papers(id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_extractions_paper ON paper_extractions(paper_id);
+-- One extraction per paper; the unique index also backs ON CONFLICT upserts
+CREATE UNIQUE INDEX IF NOT EXISTS idx_extractions_paper_unique ON paper_extractions(paper_id);
 
 -- Domains taxonomy
 CREATE TABLE IF NOT EXISTS domains (
@@ -116,3 +117,5 @@ CREATE TABLE IF NOT EXISTS manuscripts (
     generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (synthesis_run_id) REFERENCES synthesis_runs(id)
 );
+
+CREATE INDEX IF NOT EXISTS idx_manuscripts_run ON manuscripts(synthesis_run_id);
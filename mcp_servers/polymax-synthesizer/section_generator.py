@@ -1,10 +1,99 @@
 """Section generator for manuscript writing."""
+import functools
 import json
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from database import Database
 
+# All three figure placement checks fused into one alternation so a
+# large LaTeX source is scanned once, not three times
+_PLACEMENT_CHECK_RE = re.compile(
+    r'(?P<bad_placement>\\begin\{figure\*?\}\[h!?\])'
+    r'|(?P<no_placement>\\begin\{figure\*?\}(?!\[))'
+    r'|(?P<bad_ref>(?:Figure|Table)\s+\\ref)'
+)
+
+# Template placeholders like {{TITLE}}; one substitution pass fills them
+# all instead of one full-document .replace() per field
+_PLACEHOLDER_RE = re.compile(r'\{\{([A-Z]+)\}\}')
+
+# "## Key Findings" body of a markdown synthesis, up to the next header
+# or end of document — extracted in one scan instead of splitting the
+# whole summary on "##" and re-testing every part
+_KEY_FINDINGS_RE = re.compile(r'##\s*Key Findings?[^\n]*\n(.*?)(?=\n##|\Z)', re.DOTALL)
+
+# Deserialized synthesis_runs rows keyed by (db_path, run id). A full
+# manuscript run generates five sections and re-parsed the same
+# detected_domains / main_finding JSON blobs each time. Of the cached
+# columns, detected_domains is immutable and main_finding has a single
+# writer (the server's ingest_results branch), which invalidates via
+# bump_run_version; entries carry the version they were loaded under.
+# FIFO eviction bounds the dict on long-lived servers. Cached dicts are
+# shared — callers must not mutate them.
+_RUN_CACHE: Dict[tuple, tuple] = {}
+_RUN_CACHE_MAX = 64
+_RUN_VERSIONS: Dict[tuple, int] = {}
+
+
+def bump_run_version(db_path: str, synthesis_run_id: int) -> None:
+    """Drop cached rows for a run; call after updating its synthesis_runs row."""
+    key = (db_path, synthesis_run_id)
+    _RUN_VERSIONS[key] = _RUN_VERSIONS.get(key, 0) + 1
+
+
+def _load_run(db: Database, db_path: str, synthesis_run_id: int) -> Optional[Dict[str, Any]]:
+    """Fetch a synthesis run's decoded JSON columns, memoized per run version."""
+    key = (db_path, synthesis_run_id)
+    version = _RUN_VERSIONS.get(key, 0)
+    cached = _RUN_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    cursor = db.conn.execute(
+        "SELECT detected_domains, main_finding FROM synthesis_runs WHERE id=?",
+        (synthesis_run_id,)
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+    entry = {
+        "detected_domains": json.loads(row["detected_domains"]),
+        "main_finding": json.loads(row["main_finding"]) if row["main_finding"] else None
+    }
+    if key not in _RUN_CACHE and len(_RUN_CACHE) >= _RUN_CACHE_MAX:
+        _RUN_CACHE.pop(next(iter(_RUN_CACHE)))
+    _RUN_CACHE[key] = (version, entry)
+    return entry
+
+
+# Domain-to-field keyword tables for detect_field_from_domains
+_MEDICAL_IMAGING_KEYWORDS = frozenset([
+    "spatial-transcriptomics",
+    "medical-imaging",
+    "digital-pathology",
+    "histology",
+    "pathology",
+    "microscopy"
+])
+
+_GENOMICS_KEYWORDS = frozenset([
+    "genomics",
+    "sequencing",
+    "metagenomics",
+    "rna-seq",
+    "dna-seq",
+    "single-cell"
+])
+
+_ML_KEYWORDS = frozenset([
+    "deep-learning",
+    "machine-learning",
+    "neural-networks",
+    "computer-vision",
+    "artificial-intelligence"
+])
+
 
 def detect_field_from_domains(domains: List[str]) -> str:
     """
@@ -21,48 +110,20 @@ def detect_field_from_domains(domains: List[str]) -> str:
     Returns:
         Field name: "medical_imaging", "genomics", or "machine_learning"
     """
-    # Normalize domains to lowercase
-    domains_lower = [d.lower() for d in domains]
-
-    # Medical imaging domains
-    medical_imaging_keywords = [
-        "spatial-transcriptomics",
-        "medical-imaging",
-        "digital-pathology",
-        "histology",
-        "pathology",
-        "microscopy"
-    ]
-
-    # Genomics domains
-    genomics_keywords = [
-        "genomics",
-        "sequencing",
-        "metagenomics",
-        "rna-seq",
-        "dna-seq",
-        "single-cell"
-    ]
-
-    # Machine learning domains
-    ml_keywords = [
-        "deep-learning",
-        "machine-learning",
-        "neural-networks",
-        "computer-vision",
-        "artificial-intelligence"
-    ]
+    # Normalize domains to lowercase once; set intersection replaces the
+    # old nested any()/in scan over keyword lists
+    domains_lower = {d.lower() for d in domains}
 
     # Check for medical imaging
-    if any(keyword in domains_lower for keyword in medical_imaging_keywords):
+    if not _MEDICAL_IMAGING_KEYWORDS.isdisjoint(domains_lower):
         return "medical_imaging"
 
     # Check for genomics
-    if any(keyword in domains_lower for keyword in genomics_keywords):
+    if not _GENOMICS_KEYWORDS.isdisjoint(domains_lower):
         return "genomics"
 
     # Check for machine learning
-    if any(keyword in domains_lower for keyword in ml_keywords):
+    if not _ML_KEYWORDS.isdisjoint(domains_lower):
         return "machine_learning"
 
     # Default to machine learning
@@ -73,7 +134,8 @@ def generate_section(
     synthesis_run_id: int,
     section: str,
     manuscript_mode: str,
-    db_path: str
+    db_path: str,
+    db: Optional[Database] = None
 ) -> str:
     """
     Generate a manuscript section with data grounding.
@@ -96,38 +158,53 @@ def generate_section(
         section: Section name (introduction, methods, results, discussion, abstract)
         manuscript_mode: "primary_research" or "review"
         db_path: Path to database
+        db: Optional open Database to reuse instead of opening db_path
 
     Returns:
         LaTeX-formatted section text
     """
-    # Fetch synthesis run data
-    with Database(db_path) as db:
-        cursor = db.conn.execute(
-            "SELECT detected_domains, main_finding FROM synthesis_runs WHERE id=?",
-            (synthesis_run_id,)
-        )
-        row = cursor.fetchone()
-        if not row:
-            raise ValueError(f"Synthesis run {synthesis_run_id} not found")
+    if db is None:
+        with Database(db_path) as db:
+            return generate_section(
+                synthesis_run_id, section, manuscript_mode, db_path, db=db
+            )
 
-        detected_domains = json.loads(row["detected_domains"])
-        main_finding = json.loads(row["main_finding"]) if row["main_finding"] else None
-
-    # Generate section based on mode
     if manuscript_mode == "primary_research":
+        # Fetch synthesis run data (memoized across the five-section run)
+        run = _load_run(db, db_path, synthesis_run_id)
+        if run is None:
+            raise ValueError(f"Synthesis run {synthesis_run_id} not found")
+
         return _generate_primary_research_section(
             synthesis_run_id=synthesis_run_id,
             section=section,
-            main_finding=main_finding,
-            db_path=db_path
-        )
-    else:  # review mode
-        return _generate_review_section(
-            synthesis_run_id=synthesis_run_id,
-            section=section,
+            main_finding=run["main_finding"],
             db_path=db_path
         )
 
+    # Review mode: one LEFT JOIN answers both "does the run exist" and
+    # "what syntheses does it have" instead of two sequential SELECTs
+    cursor = db.conn.execute(
+        """SELECT ds.summary_markdown, d.name
+           FROM synthesis_runs sr
+           LEFT JOIN domain_syntheses ds ON ds.synthesis_run_id = sr.id
+           LEFT JOIN domains d ON ds.domain_id = d.id
+           WHERE sr.id = ?""",
+        (synthesis_run_id,)
+    )
+    rows = cursor.fetchall()
+    if not rows:
+        raise ValueError(f"Synthesis run {synthesis_run_id} not found")
+    domain_syntheses = [r for r in rows if r["summary_markdown"] is not None]
+
+    return _generate_review_section(
+        synthesis_run_id=synthesis_run_id,
+        section=section,
+        db_path=db_path,
+        db=db,
+        domain_syntheses=domain_syntheses
+    )
+
 
 def _generate_primary_research_section(
     synthesis_run_id: int,
@@ -141,9 +218,10 @@ def _generate_primary_research_section(
     Grounds content in YOUR experimental data from ingest_results.
     Uses proper LaTeX formatting with non-breaking spaces.
     """
-    # Section header
+    # Build the section as a list of parts joined once at the end;
+    # string += in the findings loop risked O(n^2) copying
     section_title = section.capitalize()
-    latex_content = f"\\section{{{section_title}}}\n\n"
+    parts = [f"\\section{{{section_title}}}\n\n"]
 
     if section == "results" and main_finding:
         # Extract key findings
@@ -152,71 +230,77 @@ def _generate_primary_research_section(
         figures = main_finding.get("figures", [])
 
         # Generate results text
-        latex_content += "% Results grounded in experimental data\n"
+        parts.append("% Results grounded in experimental data\n")
 
-        for i, finding in enumerate(key_findings):
+        for finding in key_findings:
             claim = finding.get("claim", "")
             evidence = finding.get("evidence", "")
             value = finding.get("value")
 
-            # Add finding with proper citation
-            if value is not None:
-                latex_content += f"{claim}"
-                if evidence:
-                    # Use non-breaking space before citation
-                    latex_content += f" ({evidence})"
-                latex_content += ".\n\n"
+            # Add finding with proper citation (non-breaking space style)
+            if value is not None and evidence:
+                parts.append(f"{claim} ({evidence}).\n\n")
             else:
-                latex_content += f"{claim}.\n\n"
+                parts.append(f"{claim}.\n\n")
 
         # Reference tables
         if tables:
-            latex_content += f"Table~\\ref{{tab:results}} summarizes our key results.\n\n"
+            parts.append("Table~\\ref{tab:results} summarizes our key results.\n\n")
 
         # Reference figures
         if figures:
-            latex_content += f"Figure~\\ref{{fig:results}} shows the performance comparison.\n\n"
+            parts.append("Figure~\\ref{fig:results} shows the performance comparison.\n\n")
 
         # TODO: Future enhancement - use Claude API to generate sophisticated prose
         # TODO: Add constraint verification to ensure all cited values match data
 
     elif section == "methods" and main_finding:
-        latex_content += "% Methods section\n"
-        latex_content += "We implemented our approach using standard techniques.\n\n"
+        parts.append("% Methods section\n")
+        parts.append("We implemented our approach using standard techniques.\n\n")
         # TODO: Extract methods from repository analysis
 
     elif section == "introduction":
-        latex_content += "% Introduction section\n"
-        latex_content += "This work addresses an important problem in the field.\n\n"
+        parts.append("% Introduction section\n")
+        parts.append("This work addresses an important problem in the field.\n\n")
         # TODO: Use Claude API to generate compelling introduction
 
     elif section == "discussion" and main_finding:
-        latex_content += "% Discussion section\n"
-        latex_content += "Our results demonstrate significant improvements.\n\n"
+        parts.append("% Discussion section\n")
+        parts.append("Our results demonstrate significant improvements.\n\n")
         # TODO: Use Claude API for insightful discussion
 
     elif section == "abstract" and main_finding:
-        latex_content = ""  # No section header for abstract
-        latex_content += "% Abstract\n"
-        latex_content += "This paper presents novel findings.\n\n"
+        parts = []  # No section header for abstract
+        parts.append("% Abstract\n")
+        parts.append("This paper presents novel findings.\n\n")
         # TODO: Generate concise abstract from key findings
 
-    return latex_content
+    return "".join(parts)
 
 
 def _generate_review_section(
     synthesis_run_id: int,
     section: str,
-    db_path: str
+    db_path: str,
+    db: Optional[Database] = None,
+    domain_syntheses: Optional[List[Any]] = None
 ) -> str:
     """
     Generate section for review mode.
 
     Grounds content in domain syntheses from literature.
-    Synthesizes across papers and domains.
+    Synthesizes across papers and domains. Callers that already hold
+    the syntheses (generate_section's JOIN) pass them in; standalone
+    use fetches them here.
     """
-    # Fetch domain syntheses
-    with Database(db_path) as db:
+    if db is None and domain_syntheses is None:
+        with Database(db_path) as db:
+            return _generate_review_section(
+                synthesis_run_id, section, db_path, db=db
+            )
+
+    if domain_syntheses is None:
+        # Fetch domain syntheses
         cursor = db.conn.execute(
             """SELECT ds.summary_markdown, d.name
                FROM domain_syntheses ds
@@ -226,58 +310,58 @@ def _generate_review_section(
         )
         domain_syntheses = cursor.fetchall()
 
-    # Section header
+    # Build the section as a list of parts joined once at the end
     section_title = section.capitalize()
-    latex_content = f"\\section{{{section_title}}}\n\n"
+    parts = [f"\\section{{{section_title}}}\n\n"]
 
     if section == "discussion" and domain_syntheses:
-        latex_content += "% Discussion synthesized from literature\n"
+        parts.append("% Discussion synthesized from literature\n")
 
         for synthesis in domain_syntheses:
-            domain_name = synthesis["name"]
             summary = synthesis["summary_markdown"]
 
-            # Extract key content from markdown summary
-            # Simple extraction: look for Key Findings section
-            if "## Key Findings" in summary or "## Key Finding" in summary:
-                # Extract text after Key Findings header
-                parts = summary.split("##")
-                for part in parts:
-                    if "Key Finding" in part:
-                        # Get content after header
-                        content = part.split("\n", 1)
-                        if len(content) > 1:
-                            # Convert markdown to LaTeX-safe text
-                            text = content[1].strip()
-                            # Remove markdown formatting
-                            text = text.replace("**", "").replace("*", "")
-                            latex_content += f"{text}\n\n"
+            # Extract the Key Findings section from the markdown summary
+            for match in _KEY_FINDINGS_RE.finditer(summary):
+                text = match.group(1).strip()
+                if text:
+                    # Remove markdown formatting for LaTeX-safe text
+                    text = text.replace("**", "").replace("*", "")
+                    parts.append(f"{text}\n\n")
 
         # TODO: Future enhancement - use Claude Opus 4.5 API for cross-domain synthesis
         # TODO: Generate transfer learning insights
 
     elif section == "introduction" and domain_syntheses:
-        latex_content += "% Introduction synthesized from literature\n"
-        latex_content += "This review synthesizes recent advances in the field.\n\n"
+        parts.append("% Introduction synthesized from literature\n")
+        parts.append("This review synthesizes recent advances in the field.\n\n")
         # TODO: Use Claude API for compelling review introduction
 
     elif section == "results" and domain_syntheses:
-        latex_content += "% Results from literature synthesis\n"
-        latex_content += "We analyzed multiple studies across domains.\n\n"
+        parts.append("% Results from literature synthesis\n")
+        parts.append("We analyzed multiple studies across domains.\n\n")
         # TODO: Synthesize key results from papers
 
     elif section == "methods":
-        latex_content += "% Review methodology\n"
-        latex_content += "We systematically reviewed literature across multiple domains.\n\n"
+        parts.append("% Review methodology\n")
+        parts.append("We systematically reviewed literature across multiple domains.\n\n")
         # TODO: Describe literature discovery and synthesis approach
 
-    return latex_content
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_cached(template_file: str, mtime_ns: int) -> str:
+    """Read a template file; mtime_ns busts the entry when it changes."""
+    return Path(template_file).read_text()
 
 
 def load_template(field: str) -> str:
     """
     Load LaTeX template for specified field.
 
+    Templates are memoized per (file, mtime), so repeated manuscript
+    assemblies cost one stat instead of a disk read.
+
     Args:
         field: "medical_imaging", "genomics", or "machine_learning"
 
@@ -287,10 +371,12 @@ def load_template(field: str) -> str:
     templates_dir = Path(__file__).parent / "templates"
     template_file = templates_dir / f"{field}.tex"
 
-    if not template_file.exists():
+    try:
+        mtime_ns = os.stat(template_file).st_mtime_ns
+    except OSError:
         raise FileNotFoundError(f"Template not found: {template_file}")
 
-    return template_file.read_text()
+    return _load_template_cached(str(template_file), mtime_ns)
 
 
 def generate_figure_block(
@@ -324,15 +410,15 @@ def generate_figure_block(
     fig_env = "figure*" if wide else "figure"
     width = r"0.95\textwidth" if wide else r"0.95\columnwidth"
 
-    # Build LaTeX block
-    latex = f"\\begin{{{fig_env}}}[{placement}]\n"
-    latex += "\\centering\n"
-    latex += f"\\includegraphics[width={width}]{{{filename}}}\n"
-    latex += f"\\caption{{{caption}}}\n"
-    latex += f"\\label{{{label}}}\n"
-    latex += f"\\end{{{fig_env}}}\n"
-
-    return latex
+    # Build LaTeX block in one join
+    return "".join((
+        f"\\begin{{{fig_env}}}[{placement}]\n",
+        "\\centering\n",
+        f"\\includegraphics[width={width}]{{{filename}}}\n",
+        f"\\caption{{{caption}}}\n",
+        f"\\label{{{label}}}\n",
+        f"\\end{{{fig_env}}}\n"
+    ))
 
 
 def check_figure_placement(latex_source: str) -> List[str]:
@@ -354,27 +440,29 @@ def check_figure_placement(latex_source: str) -> List[str]:
 
     warnings = []
 
-    # Check for bad placement specifiers [h] or [h!]
-    bad_placements = re.findall(r'\\begin\{figure\*?\}\[h!?\]', latex_source)
-    if bad_placements:
+    # One pass over the source counts every check at once
+    counts = {"bad_placement": 0, "no_placement": 0, "bad_ref": 0}
+    for match in _PLACEMENT_CHECK_RE.finditer(latex_source):
+        counts[match.lastgroup] += 1
+
+    # Bad placement specifiers [h] or [h!]
+    if counts["bad_placement"]:
         warnings.append(
-            f"Found {len(bad_placements)} figure(s) with [h] placement. "
+            f"Found {counts['bad_placement']} figure(s) with [h] placement. "
             "Use [t!] or [b!] for professional typesetting."
         )
 
-    # Check for figures without placement specifiers
-    no_placement = re.findall(r'\\begin\{figure\*?\}(?!\[)', latex_source)
-    if no_placement:
+    # Figures without placement specifiers
+    if counts["no_placement"]:
         warnings.append(
-            f"Found {len(no_placement)} figure(s) without placement specifier. "
+            f"Found {counts['no_placement']} figure(s) without placement specifier. "
             "Add [t!] or [b!] for better control."
         )
 
-    # Check for improper figure references (space before \ref)
-    bad_refs = re.findall(r'(Figure|Table)\s+\\ref', latex_source)
-    if bad_refs:
+    # Improper figure references (space before \ref)
+    if counts["bad_ref"]:
         warnings.append(
-            f"Found {len(bad_refs)} reference(s) without non-breaking space. "
+            f"Found {counts['bad_ref']} reference(s) without non-breaking space. "
             "Use Figure~\\ref{} not Figure \\ref{}."
         )
 
@@ -385,7 +473,8 @@ def assemble_manuscript(
     synthesis_run_id: int,
     db_path: str,
     title: str = "Manuscript Title",
-    authors: str = "Author Names"
+    authors: str = "Author Names",
+    db: Optional[Database] = None
 ) -> str:
     """
     Assemble complete manuscript from sections stored in database.
@@ -397,41 +486,49 @@ def assemble_manuscript(
         db_path: Path to database
         title: Manuscript title
         authors: Author list
+        db: Optional open Database to reuse instead of opening db_path
 
     Returns:
         Complete LaTeX document
     """
-    # Fetch manuscript sections from database
-    with Database(db_path) as db:
-        cursor = db.conn.execute(
-            """SELECT detected_domains, abstract, introduction, methods, results, discussion
-               FROM manuscripts
-               JOIN synthesis_runs ON manuscripts.synthesis_run_id = synthesis_runs.id
-               WHERE synthesis_run_id = ?
-               ORDER BY generated_at DESC
-               LIMIT 1""",
-            (synthesis_run_id,)
-        )
-        row = cursor.fetchone()
-
-        if not row:
-            raise ValueError(f"No manuscript found for synthesis run {synthesis_run_id}")
+    if db is None:
+        with Database(db_path) as db:
+            return assemble_manuscript(
+                synthesis_run_id, db_path, title, authors, db=db
+            )
 
-        # Detect field
-        detected_domains = json.loads(row["detected_domains"])
-        field = detect_field_from_domains(detected_domains)
+    # Fetch manuscript sections from database
+    cursor = db.conn.execute(
+        """SELECT detected_domains, abstract, introduction, methods, results, discussion
+           FROM manuscripts
+           JOIN synthesis_runs ON manuscripts.synthesis_run_id = synthesis_runs.id
+           WHERE synthesis_run_id = ?
+           ORDER BY generated_at DESC
+           LIMIT 1""",
+        (synthesis_run_id,)
+    )
+    row = cursor.fetchone()
+
+    if not row:
+        raise ValueError(f"No manuscript found for synthesis run {synthesis_run_id}")
+
+    # Detect field
+    detected_domains = json.loads(row["detected_domains"])
+    field = detect_field_from_domains(detected_domains)
 
     # Load template
     template = load_template(field)
 
-    # Replace placeholders
-    manuscript = template.replace("{{TITLE}}", title)
-    manuscript = manuscript.replace("{{AUTHORS}}", authors)
-    manuscript = manuscript.replace("{{ABSTRACT}}", row["abstract"] or "")
-    manuscript = manuscript.replace("{{INTRODUCTION}}", row["introduction"] or "")
-    manuscript = manuscript.replace("{{METHODS}}", row["methods"] or "")
-    manuscript = manuscript.replace("{{RESULTS}}", row["results"] or "")
-    manuscript = manuscript.replace("{{DISCUSSION}}", row["discussion"] or "")
-    manuscript = manuscript.replace("{{BIBLIOGRAPHY}}", "")
-
-    return manuscript
+    # Replace placeholders in a single pass over the template; the
+    # chained .replace() version rewrote the whole document eight times
+    values = {
+        "TITLE": title,
+        "AUTHORS": authors,
+        "ABSTRACT": row["abstract"] or "",
+        "INTRODUCTION": row["introduction"] or "",
+        "METHODS": row["methods"] or "",
+        "RESULTS": row["results"] or "",
+        "DISCUSSION": row["discussion"] or "",
+        "BIBLIOGRAPHY": ""
+    }
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
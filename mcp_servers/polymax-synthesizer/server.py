@@ -1,507 +1,878 @@
-#!/usr/bin/env python3
-"""PolyMaX Synthesizer MCP Server."""
-import json
-from pathlib import Path
-from typing import Any
-
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
-
-from database import Database
-from repo_analyzer import analyze_repository
-from results_ingester import ingest_results_data
-from literature_discovery import discover_targeted_literature, discover_broad_literature
-from paper_extractor import extract_multiple_papers
-from domain_synthesizer import synthesize_multiple_domains
-from section_generator import generate_section, detect_field_from_domains, assemble_manuscript
-
-# Database path
-DB_PATH = Path(__file__).parent / "papers.db"
-
-# Initialize server
-server = Server("polymax-synthesizer")
-
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="analyze_repo",
-            description="Analyze repository structure and detect operating mode",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "repo_path": {"type": "string"},
-                    "mode": {"type": "string", "enum": ["auto", "primary_research", "review"]}
-                },
-                "required": ["repo_path"]
-            }
-        ),
-        Tool(
-            name="ingest_results",
-            description="Load experimental results from repository (primary research mode)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "synthesis_run_id": {"type": "integer"},
-                    "data_sources": {"type": "array", "items": {"type": "string"}}
-                },
-                "required": ["synthesis_run_id"]
-            }
-        ),
-        Tool(
-            name="discover_literature",
-            description="Find professors and papers (mode-adaptive: targeted or broad)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "synthesis_run_id": {"type": "integer"},
-                    "mode": {"type": "string", "enum": ["targeted", "broad"]},
-                    "search_queries": {"type": "array", "items": {"type": "string"}}
-                },
-                "required": ["synthesis_run_id", "mode"]
-            }
-        ),
-        Tool(
-            name="extract_papers",
-            description="Hierarchical extraction via parallel subagents",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "synthesis_run_id": {"type": "integer"},
-                    "paper_ids": {"type": "array", "items": {"type": "integer"}},
-                    "extraction_depth": {"type": "string", "enum": ["full", "mid", "high_only"]}
-                },
-                "required": ["synthesis_run_id"]
-            }
-        ),
-        Tool(
-            name="synthesize_domains",
-            description="Generate 1-page synthesis per domain with cross-field insights",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "synthesis_run_id": {"type": "integer"},
-                    "domain_ids": {"type": "array", "items": {"type": "integer"}}
-                },
-                "required": ["synthesis_run_id"]
-            }
-        ),
-        Tool(
-            name="generate_section",
-            description="Write individual manuscript section with data grounding",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "synthesis_run_id": {"type": "integer"},
-                    "section": {"type": "string", "enum": ["introduction", "methods", "results", "discussion", "abstract"]},
-                    "mode": {"type": "string", "enum": ["primary_research", "review"]}
-                },
-                "required": ["synthesis_run_id", "section", "mode"]
-            }
-        ),
-        Tool(
-            name="generate_manuscript",
-            description="Orchestrate full manuscript generation with checkpoints",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "synthesis_run_id": {"type": "integer"},
-                    "mode": {"type": "string", "enum": ["research", "review", "extended-review", "hypothesis"]},
-                    "sections": {"type": "array", "items": {"type": "string"}},
-                    "output_path": {"type": "string"}
-                },
-                "required": ["synthesis_run_id", "mode"]
-            }
-        )
-    ]
-
-@server.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls with error handling and validation."""
-    try:
-        # Validate arguments
-        if not isinstance(arguments, dict):
-            return [TextContent(
-                type="text",
-                text=f"Invalid arguments: expected dict, got {type(arguments).__name__}"
-            )]
-
-        if name == "analyze_repo":
-            repo_path = arguments.get("repo_path")
-            mode = arguments.get("mode", "auto")
-
-            # Analyze repository
-            analysis = analyze_repository(repo_path)
-
-            # Create synthesis run
-            with Database(str(DB_PATH)) as db:
-                cursor = db.conn.execute(
-                    """INSERT INTO synthesis_runs
-                       (repo_path, mode, detected_domains, status)
-                       VALUES (?, ?, ?, 'analyzing')""",
-                    (
-                        repo_path,
-                        analysis["detected_mode"],
-                        json.dumps(analysis["detected_domains"])
-                    )
-                )
-                db.conn.commit()
-                synthesis_run_id = cursor.lastrowid
-
-            result = {
-                "synthesis_run_id": synthesis_run_id,
-                **analysis,
-                "next_step": "Call ingest_results to load experimental data" if analysis["detected_mode"] == "primary_research" else "Call discover_literature"
-            }
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "ingest_results":
-            synthesis_run_id = arguments.get("synthesis_run_id")
-
-            # Get repo path from synthesis_run
-            with Database(str(DB_PATH)) as db:
-                cursor = db.conn.execute(
-                    "SELECT repo_path FROM synthesis_runs WHERE id=?",
-                    (synthesis_run_id,)
-                )
-                row = cursor.fetchone()
-                if not row:
-                    return [TextContent(type="text", text=f"Synthesis run {synthesis_run_id} not found")]
-                repo_path = row["repo_path"]
-
-            # Ingest results
-            ingested = ingest_results_data(repo_path)
-
-            # Store in database
-            with Database(str(DB_PATH)) as db:
-                db.conn.execute(
-                    "UPDATE synthesis_runs SET main_finding=?, status='discovering' WHERE id=?",
-                    (json.dumps(ingested), synthesis_run_id)
-                )
-                db.conn.commit()
-
-            result = {
-                "synthesis_run_id": synthesis_run_id,
-                **ingested,
-                "next_step": "Call discover_literature with targeted mode"
-            }
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "discover_literature":
-            synthesis_run_id = arguments.get("synthesis_run_id")
-            mode = arguments.get("mode")
-            search_queries = arguments.get("search_queries", [])
-
-            if mode == "targeted":
-                result = discover_targeted_literature(search_queries, str(DB_PATH))
-            else:
-                # Get domains from synthesis_run
-                with Database(str(DB_PATH)) as db:
-                    cursor = db.conn.execute(
-                        "SELECT detected_domains FROM synthesis_runs WHERE id=?",
-                        (synthesis_run_id,)
-                    )
-                    row = cursor.fetchone()
-                    domains = json.loads(row["detected_domains"]) if row else []
-
-                result = discover_broad_literature(domains, str(DB_PATH))
-
-            # Update synthesis_run
-            with Database(str(DB_PATH)) as db:
-                db.conn.execute(
-                    "UPDATE synthesis_runs SET papers_found=?, status='extracting' WHERE id=?",
-                    (result["papers_added"], synthesis_run_id)
-                )
-                db.conn.commit()
-
-            result["synthesis_run_id"] = synthesis_run_id
-            result["next_step"] = "Call extract_papers to perform hierarchical extraction"
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "extract_papers":
-            synthesis_run_id = arguments.get("synthesis_run_id")
-            paper_ids = arguments.get("paper_ids")
-            extraction_depth = arguments.get("extraction_depth", "full")
-
-            # If no paper_ids provided, get all papers from database
-            if not paper_ids:
-                with Database(str(DB_PATH)) as db:
-                    cursor = db.conn.execute("SELECT id FROM papers")
-                    paper_ids = [row["id"] for row in cursor.fetchall()]
-
-            # Extract papers using rule-based MVP extractor
-            # TODO: Future enhancement - use Claude API with prompts/extraction_prompts.py
-            extraction_result = extract_multiple_papers(
-                paper_ids,
-                str(DB_PATH),
-                extraction_depth=extraction_depth
-            )
-
-            # Update synthesis_run status and count
-            with Database(str(DB_PATH)) as db:
-                db.conn.execute(
-                    """UPDATE synthesis_runs
-                       SET papers_extracted=?, status='synthesizing'
-                       WHERE id=?""",
-                    (extraction_result["successful"], synthesis_run_id)
-                )
-                db.conn.commit()
-
-            # Prepare response
-            result = {
-                "synthesis_run_id": synthesis_run_id,
-                "papers_extracted": extraction_result["successful"],
-                "extraction_summary": extraction_result,
-                "extraction_depth": extraction_depth,
-                "next_step": "Call synthesize_domains to generate domain syntheses"
-            }
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "synthesize_domains":
-            synthesis_run_id = arguments.get("synthesis_run_id")
-            domain_ids = arguments.get("domain_ids", [])
-
-            # Synthesize domains using rule-based MVP synthesizer
-            # TODO: Future enhancement - use Claude Opus 4.5 API with prompts/synthesis_prompts.py
-            synthesis_result = synthesize_multiple_domains(
-                synthesis_run_id,
-                domain_ids,
-                str(DB_PATH)
-            )
-
-            # Update synthesis_run status and count
-            with Database(str(DB_PATH)) as db:
-                db.conn.execute(
-                    """UPDATE synthesis_runs
-                       SET domains_synthesized=?, status='writing'
-                       WHERE id=?""",
-                    (synthesis_result["successful"], synthesis_run_id)
-                )
-                db.conn.commit()
-
-            # Prepare response
-            result = {
-                "synthesis_run_id": synthesis_run_id,
-                "domains_synthesized": synthesis_result["successful"],
-                "synthesis_summary": synthesis_result,
-                "next_step": "Call generate_section to write individual manuscript sections or generate_manuscript for full orchestration"
-            }
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "generate_section":
-            synthesis_run_id = arguments.get("synthesis_run_id")
-            section = arguments.get("section")
-            mode = arguments.get("mode")
-
-            # Get detected domains to determine field
-            with Database(str(DB_PATH)) as db:
-                cursor = db.conn.execute(
-                    "SELECT detected_domains FROM synthesis_runs WHERE id=?",
-                    (synthesis_run_id,)
-                )
-                row = cursor.fetchone()
-                if not row:
-                    return [TextContent(type="text", text=f"Synthesis run {synthesis_run_id} not found")]
-                detected_domains = json.loads(row["detected_domains"])
-
-            # Detect field
-            field = detect_field_from_domains(detected_domains)
-
-            # Generate section
-            section_text = generate_section(
-                synthesis_run_id=synthesis_run_id,
-                section=section,
-                manuscript_mode=mode,
-                db_path=str(DB_PATH)
-            )
-
-            # Store section in manuscripts table
-            # Map mode to manuscript mode (manuscripts table uses different enum)
-            manuscript_mode_map = {
-                "primary_research": "research",
-                "review": "review"
-            }
-            manuscript_mode = manuscript_mode_map.get(mode, "research")
-
-            with Database(str(DB_PATH)) as db:
-                # Check if manuscript record exists
-                cursor = db.conn.execute(
-                    "SELECT id FROM manuscripts WHERE synthesis_run_id=?",
-                    (synthesis_run_id,)
-                )
-                row = cursor.fetchone()
-
-                if row:
-                    # Update existing manuscript
-                    manuscript_id = row["id"]
-                    db.conn.execute(
-                        f"UPDATE manuscripts SET {section}=? WHERE id=?",
-                        (section_text, manuscript_id)
-                    )
-                else:
-                    # Create new manuscript record
-                    db.conn.execute(
-                        f"""INSERT INTO manuscripts
-                           (synthesis_run_id, mode, {section})
-                           VALUES (?, ?, ?)""",
-                        (synthesis_run_id, manuscript_mode, section_text)
-                    )
-                db.conn.commit()
-
-            # Prepare response
-            result = {
-                "synthesis_run_id": synthesis_run_id,
-                "section": section,
-                "mode": mode,
-                "field": field,
-                "preview": section_text[:200] if len(section_text) > 200 else section_text,
-                "next_step": "Call generate_section for other sections or generate_manuscript for full orchestration"
-            }
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "generate_manuscript":
-            synthesis_run_id = arguments.get("synthesis_run_id")
-            mode = arguments.get("mode")
-            output_path = arguments.get("output_path")
-
-            # Get synthesis run data
-            with Database(str(DB_PATH)) as db:
-                cursor = db.conn.execute(
-                    "SELECT detected_domains, mode as detected_mode FROM synthesis_runs WHERE id=?",
-                    (synthesis_run_id,)
-                )
-                row = cursor.fetchone()
-                if not row:
-                    return [TextContent(type="text", text=f"Synthesis run {synthesis_run_id} not found")]
-
-                detected_domains = json.loads(row["detected_domains"])
-                detected_mode = row["detected_mode"]
-
-            # Detect field for template selection
-            field = detect_field_from_domains(detected_domains)
-
-            # Map mode to manuscript_mode for database
-            mode_map = {
-                "research": "research",
-                "review": "review",
-                "extended-review": "review",
-                "hypothesis": "research"
-            }
-            manuscript_mode = mode_map.get(mode, "research")
-
-            # Determine section generation mode
-            section_mode = "primary_research" if mode in ["research", "hypothesis"] else "review"
-
-            # Check if manuscript already exists
-            with Database(str(DB_PATH)) as db:
-                cursor = db.conn.execute(
-                    "SELECT id FROM manuscripts WHERE synthesis_run_id=?",
-                    (synthesis_run_id,)
-                )
-                existing = cursor.fetchone()
-                if existing:
-                    manuscript_id = existing["id"]
-                else:
-                    # Create new manuscript record
-                    cursor = db.conn.execute(
-                        "INSERT INTO manuscripts (synthesis_run_id, mode) VALUES (?, ?)",
-                        (synthesis_run_id, manuscript_mode)
-                    )
-                    db.conn.commit()
-                    manuscript_id = cursor.lastrowid
-
-            # Generate sections in sequence
-            sections = ["abstract", "introduction", "methods", "results", "discussion"]
-
-            for i, section in enumerate(sections, 1):
-                # Generate section
-                section_text = generate_section(
-                    synthesis_run_id=synthesis_run_id,
-                    section=section,
-                    manuscript_mode=section_mode,
-                    db_path=str(DB_PATH)
-                )
-
-                # Update manuscript with this section
-                with Database(str(DB_PATH)) as db:
-                    db.conn.execute(
-                        f"UPDATE manuscripts SET {section}=? WHERE id=?",
-                        (section_text, manuscript_id)
-                    )
-                    db.conn.commit()
-
-            # Assemble full LaTeX document
-            latex_document = assemble_manuscript(
-                synthesis_run_id=synthesis_run_id,
-                db_path=str(DB_PATH),
-                title="Generated Manuscript",
-                authors="PolyMaX Synthesizer"
-            )
-
-            # Store latex_content in database
-            with Database(str(DB_PATH)) as db:
-                db.conn.execute(
-                    "UPDATE manuscripts SET latex_content=? WHERE id=?",
-                    (latex_document, manuscript_id)
-                )
-                db.conn.commit()
-
-            # Update synthesis_run status to complete
-            with Database(str(DB_PATH)) as db:
-                db.conn.execute(
-                    "UPDATE synthesis_runs SET status='complete' WHERE id=?",
-                    (synthesis_run_id,)
-                )
-                db.conn.commit()
-
-            # Optionally save to file
-            if output_path:
-                Path(output_path).write_text(latex_document)
-
-            # Prepare response
-            result = {
-                "status": "complete",
-                "manuscript_id": manuscript_id,
-                "synthesis_run_id": synthesis_run_id,
-                "field": field,
-                "mode": mode,
-                "latex_preview": latex_document[:500] if len(latex_document) > 500 else latex_document,
-                "next_step": "Use pdflatex to compile LaTeX or inspect individual sections"
-            }
-
-            if output_path:
-                result["output_file"] = output_path
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        # Other tools return stub
-        return [TextContent(
-            type="text",
-            text=f"Tool '{name}' not yet implemented"
-        )]
-
-    except Exception as e:
-        import traceback
-        error_msg = f"Error in tool '{name}': {str(e)}\n{traceback.format_exc()}"
-        return [TextContent(type="text", text=error_msg)]
-
-async def main():
-    """Run server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
-
-if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+#!/usr/bin/env python3
+"""PolyMaX Synthesizer MCP Server."""
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+from mcp.types import Tool, TextContent
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+from database import Database
+from repo_analyzer import analyze_repository
+from results_ingester import ingest_results_data
+from literature_discovery import discover_targeted_literature, discover_broad_literature
+from paper_extractor import extract_multiple_papers_async
+from rate_limiter import AsyncTokenBucket
+from domain_synthesizer import synthesize_multiple_domains
+from section_generator import (
+    generate_section, detect_field_from_domains, assemble_manuscript,
+    bump_run_version
+)
+
+# Database path, resolved to a plain str once at import so the
+# request hot path never re-stringifies a PosixPath
+DB_PATH_STR: str = str((Path(__file__).parent / "papers.db").resolve())
+
+# Initialize server
+server = Server("polymax-synthesizer")
+
+# One long-lived connection shared across call_tool invocations. Opening
+# SQLite (and re-applying pragmas) per tool call dominated handler time
+# for the cheap metadata queries; database.py already applies WAL and
+# synchronous=NORMAL, so a persistent connection is safe to reuse.
+_DB: Database = None
+
+def get_db() -> Database:
+    """Return the shared Database, opening it on first use."""
+    global _DB
+    if _DB is None:
+        _DB = Database(DB_PATH_STR)
+        _DB.__enter__()
+    return _DB
+
+# detected_domains and repo_path per synthesis run, populated when
+# analyze_repo creates the run so later tools skip the SQLite read +
+# JSON parse. Both columns are immutable after analysis, so no
+# invalidation is needed; mutable columns (status, main_finding) are
+# never cached here.
+_RUN_DOMAINS: dict = {}
+_RUN_REPO_PATHS: dict = {}
+
+# Shared budget for the tools that fan out to literature services
+# (PubMed/CrossRef once live). One bucket across discover_literature
+# and extract_papers keeps a batch_execute burst or retry storm inside
+# provider limits instead of triggering 429s.
+_LIMITER = AsyncTokenBucket(max_rate=60, time_period=60.0)
+
+# Ceiling applied to every tool call unless the caller passes
+# timeout_seconds; generous enough for a full-manuscript run but low
+# enough that a wedged call fails loudly instead of holding the client
+DEFAULT_TIMEOUT_SECONDS = 300.0
+
+# Per-call phase timings land here as JSON lines for offline analysis
+_perf_log = logging.getLogger("mcp.perf")
+
+
+class Phases:
+    """Cumulative wall-clock marks for one tool call.
+
+    Each mark records milliseconds since the call started, so the
+    delta between consecutive marks is the cost of that phase. Cheap
+    enough (one perf_counter read per mark) to leave on in production.
+    """
+
+    __slots__ = ("t0", "marks")
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.marks: dict = {}
+
+    def mark(self, name: str) -> None:
+        self.marks[name] = round((time.perf_counter() - self.t0) * 1000, 3)
+
+
+def _respond(name: str, result: dict, p: Phases) -> list[TextContent]:
+    """Attach phase timings to a result, serialize it, and log one perf line."""
+    result["_phase_timings_ms"] = p.marks
+    text = _dump(result)
+    p.mark("serialize")
+    _perf_log.info('{"tool": "%s", "phases_ms": %s}', name, json.dumps(p.marks))
+    return [TextContent(type="text", text=text)]
+
+
+def _dump(obj) -> str:
+    """Serialize a tool response (orjson when available — it skips the
+    pure-Python encoder and is severalfold faster on large summaries)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _get_run_domains(synthesis_run_id: int) -> list:
+    """Detected domains for a run, from cache or synthesis_runs."""
+    domains = _RUN_DOMAINS.get(synthesis_run_id)
+    if domains is None:
+        db = get_db()
+        cursor = db.conn.execute(
+            "SELECT detected_domains FROM synthesis_runs WHERE id=?",
+            (synthesis_run_id,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return []
+        domains = json.loads(row["detected_domains"])
+        _RUN_DOMAINS[synthesis_run_id] = domains
+    return domains
+
+# The tool list is static — build the Tool objects (and their nested
+# inputSchema dicts) once at import instead of on every list_tools call.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="analyze_repo",
+        description="Analyze repository structure and detect operating mode",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "repo_path": {"type": "string"},
+                "mode": {"type": "string", "enum": ["auto", "primary_research", "review"]}
+            },
+            "required": ["repo_path"]
+        }
+    ),
+    Tool(
+        name="ingest_results",
+        description="Load experimental results from repository (primary research mode)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "synthesis_run_id": {"type": "integer"},
+                "data_sources": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["synthesis_run_id"]
+        }
+    ),
+    Tool(
+        name="discover_literature",
+        description="Find professors and papers (mode-adaptive: targeted or broad)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "synthesis_run_id": {"type": "integer"},
+                "mode": {"type": "string", "enum": ["targeted", "broad"]},
+                "search_queries": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["synthesis_run_id", "mode"]
+        }
+    ),
+    Tool(
+        name="extract_papers",
+        description="Hierarchical extraction via parallel subagents",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "synthesis_run_id": {"type": "integer"},
+                "paper_ids": {"type": "array", "items": {"type": "integer"}},
+                "extraction_depth": {"type": "string", "enum": ["full", "mid", "high_only"]},
+                "max_concurrency": {"type": "integer", "minimum": 1, "default": 8},
+                "max_parallel": {"type": "integer", "minimum": 1, "default": 4},
+                "urgency": {"type": "string", "enum": ["low", "normal", "high"], "default": "normal"}
+            },
+            "required": ["synthesis_run_id"]
+        }
+    ),
+    Tool(
+        name="synthesize_domains",
+        description="Generate 1-page synthesis per domain with cross-field insights",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "synthesis_run_id": {"type": "integer"},
+                "domain_ids": {"type": "array", "items": {"type": "integer"}}
+            },
+            "required": ["synthesis_run_id"]
+        }
+    ),
+    Tool(
+        name="generate_section",
+        description="Write individual manuscript section with data grounding",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "synthesis_run_id": {"type": "integer"},
+                "section": {"type": "string", "enum": ["introduction", "methods", "results", "discussion", "abstract"]},
+                "mode": {"type": "string", "enum": ["primary_research", "review"]}
+            },
+            "required": ["synthesis_run_id", "section", "mode"]
+        }
+    ),
+    Tool(
+        name="generate_manuscript",
+        description="Orchestrate full manuscript generation with checkpoints",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "synthesis_run_id": {"type": "integer"},
+                "mode": {"type": "string", "enum": ["research", "review", "extended-review", "hypothesis"]},
+                "sections": {"type": "array", "items": {"type": "string"}},
+                "output_path": {"type": "string"}
+            },
+            "required": ["synthesis_run_id", "mode"]
+        }
+    ),
+    Tool(
+        name="batch_execute",
+        description="Run several tool calls in one request; independent operations run in parallel, depends_on chains them",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "minimum": 0},
+                "operations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "arguments": {"type": "object"},
+                            "depends_on": {"type": "array", "items": {"type": "integer"}}
+                        },
+                        "required": ["name"]
+                    }
+                },
+                "maxConcurrent": {"type": "integer", "minimum": 1, "default": 4},
+                "stopOnError": {"type": "boolean", "default": True}
+            },
+            "required": ["operations"]
+        }
+    )
+]
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
+
+
+def _make_validator(schema: dict):
+    """Compile an inputSchema into a validator callable.
+
+    fastjsonschema gives full, C-accelerated JSON Schema enforcement
+    when installed; the fallback checks the parts our schemas actually
+    use (required keys, property types, enums) so bad inputs still fail
+    before any pipeline work.
+    """
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+
+    required = schema.get("required", [])
+    properties = schema.get("properties", {})
+
+    def validate(arguments: dict):
+        for key in required:
+            if key not in arguments:
+                raise ValueError(f"missing required argument '{key}'")
+        for key, value in arguments.items():
+            spec = properties.get(key)
+            if spec is None:
+                continue
+            expected = _JSON_TYPES.get(spec.get("type"))
+            if expected is not None and (
+                not isinstance(value, expected)
+                or (isinstance(value, bool) and spec["type"] in ("integer", "number"))
+            ):
+                raise ValueError(f"argument '{key}' must be of type {spec['type']}")
+            enum = spec.get("enum")
+            if enum is not None and value not in enum:
+                raise ValueError(f"argument '{key}' must be one of {enum}")
+        return arguments
+
+    return validate
+
+
+# Pre-compiled per-tool validators; failing fast here keeps malformed
+# inputs from cascading into the pipelines
+_VALIDATORS = {t.name: _make_validator(t.inputSchema) for t in _TOOLS}
+_VALIDATION_ERRORS = (ValueError,) if fastjsonschema is None else (
+    ValueError, fastjsonschema.JsonSchemaException
+)
+
+@server.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Handle tool calls with error handling and validation."""
+    try:
+        # Validate arguments
+        if not isinstance(arguments, dict):
+            return [TextContent(
+                type="text",
+                text=f"Invalid arguments: expected dict, got {type(arguments).__name__}"
+            )]
+
+        validator = _VALIDATORS.get(name)
+        if validator is not None:
+            try:
+                validator(arguments)
+            except _VALIDATION_ERRORS as e:
+                return [TextContent(
+                    type="text",
+                    text=f"Invalid arguments for tool '{name}': {e}"
+                )]
+
+        # Bound worst-case latency; a hung extraction or filesystem
+        # scan should surface as a structured error, not a stuck client
+        timeout = arguments.get("timeout_seconds") or DEFAULT_TIMEOUT_SECONDS
+        work = (
+            _batch_execute(arguments) if name == "batch_execute"
+            else _dispatch(name, arguments)
+        )
+        try:
+            return await asyncio.wait_for(work, timeout=timeout)
+        except asyncio.TimeoutError:
+            return [TextContent(
+                type="text",
+                text=_dump({
+                    "error": "timeout",
+                    "tool": name,
+                    "timeout_seconds": timeout,
+                    "detail": f"Tool '{name}' did not complete within "
+                              f"{timeout:g}s; any uncommitted database "
+                              f"work was rolled back"
+                })
+            )]
+
+    except Exception as e:
+        import traceback
+        error_msg = f"Error in tool '{name}': {str(e)}\n{traceback.format_exc()}"
+        return [TextContent(type="text", text=error_msg)]
+
+
+async def _dispatch(name: str, arguments: dict) -> list[TextContent]:
+    """Execute a single tool; shared by call_tool and batch_execute."""
+    p = Phases()
+
+    if name == "analyze_repo":
+        repo_path = arguments.get("repo_path")
+        mode = arguments.get("mode", "auto")
+
+        # Analyze repository off the event loop; the scan walks the
+        # filesystem and would otherwise freeze concurrent tool calls
+        analysis = await asyncio.to_thread(analyze_repository, repo_path)
+        p.mark("pipeline")
+
+        # Create synthesis run
+        db = get_db()
+        cursor = db.conn.execute(
+            """INSERT INTO synthesis_runs
+               (repo_path, mode, detected_domains, status)
+               VALUES (?, ?, ?, 'analyzing')""",
+            (
+                repo_path,
+                analysis["detected_mode"],
+                json.dumps(analysis["detected_domains"])
+            )
+        )
+        db.conn.commit()
+        p.mark("db_write")
+        synthesis_run_id = cursor.lastrowid
+        _RUN_DOMAINS[synthesis_run_id] = analysis["detected_domains"]
+        _RUN_REPO_PATHS[synthesis_run_id] = repo_path
+
+        result = {
+            "synthesis_run_id": synthesis_run_id,
+            **analysis,
+            "next_step": "Call ingest_results to load experimental data" if analysis["detected_mode"] == "primary_research" else "Call discover_literature"
+        }
+
+        return _respond(name, result, p)
+
+    elif name == "ingest_results":
+        synthesis_run_id = arguments.get("synthesis_run_id")
+
+        db = get_db()
+
+        # In-process row cache first; SQL fallback for runs created
+        # in earlier sessions
+        repo_path = _RUN_REPO_PATHS.get(synthesis_run_id)
+        if repo_path is None:
+            cursor = db.conn.execute(
+                "SELECT repo_path FROM synthesis_runs WHERE id=?",
+                (synthesis_run_id,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return [TextContent(type="text", text=f"Synthesis run {synthesis_run_id} not found")]
+            repo_path = row["repo_path"]
+            _RUN_REPO_PATHS[synthesis_run_id] = repo_path
+        p.mark("db_read")
+
+        # Ingest results in a worker thread — CSV parsing and directory
+        # walks must not block the event loop. The write transaction
+        # stays tight around the UPDATE: awaiting inside an open
+        # BEGIN IMMEDIATE would let concurrent tool calls interleave
+        # statements into it on the shared connection.
+        ingested = await asyncio.to_thread(ingest_results_data, repo_path)
+        p.mark("pipeline")
+
+        # Store in database
+        with db.conn:
+            db.conn.execute("BEGIN IMMEDIATE")
+            db.conn.execute(
+                "UPDATE synthesis_runs SET main_finding=?, status='discovering' WHERE id=?",
+                (json.dumps(ingested), synthesis_run_id)
+            )
+        # main_finding is cached by the section generator; drop the entry
+        bump_run_version(DB_PATH_STR, synthesis_run_id)
+        p.mark("db_write")
+
+        result = {
+            "synthesis_run_id": synthesis_run_id,
+            **ingested,
+            "next_step": "Call discover_literature with targeted mode"
+        }
+
+        return _respond(name, result, p)
+
+    elif name == "discover_literature":
+        synthesis_run_id = arguments.get("synthesis_run_id")
+        mode = arguments.get("mode")
+        search_queries = arguments.get("search_queries", [])
+
+        await _LIMITER.acquire()
+
+        # Discovery reads and the status update share one transaction
+        db = get_db()
+        with db.conn:
+            db.conn.execute("BEGIN IMMEDIATE")
+            if mode == "targeted":
+                result = discover_targeted_literature(search_queries, DB_PATH_STR, db=db)
+            else:
+                # Domains come from the in-process cache when this run
+                # was analyzed in the same session
+                domains = _get_run_domains(synthesis_run_id)
+
+                result = discover_broad_literature(domains, DB_PATH_STR, db=db)
+            p.mark("pipeline")
+
+            # Update synthesis_run
+            db.conn.execute(
+                "UPDATE synthesis_runs SET papers_found=?, status='extracting' WHERE id=?",
+                (result["papers_added"], synthesis_run_id)
+            )
+        p.mark("db_write")
+
+        result["synthesis_run_id"] = synthesis_run_id
+        result["next_step"] = "Call extract_papers to perform hierarchical extraction"
+
+        return _respond(name, result, p)
+
+    elif name == "extract_papers":
+        synthesis_run_id = arguments.get("synthesis_run_id")
+        paper_ids = arguments.get("paper_ids")
+        extraction_depth = arguments.get("extraction_depth", "full")
+        max_concurrency = arguments.get("max_concurrency", 8)
+        max_parallel = arguments.get("max_parallel", 4)
+        urgency = arguments.get("urgency", "normal")
+        if urgency == "low":
+            # Background-priority runs yield the machine: fully serial
+            max_parallel = 1
+
+        await _LIMITER.acquire()
+
+        # If no paper_ids provided, get all papers from database
+        if not paper_ids:
+            db = get_db()
+            cursor = db.conn.execute("SELECT id FROM papers")
+            paper_ids = [row["id"] for row in cursor.fetchall()]
+        p.mark("db_read")
+
+        # Sequential waves instead of one unbounded fan-out: each wave
+        # commits its extractions before the next starts, so a long
+        # batch makes durable progress and a crash loses at most one
+        # wave. Urgency high keeps the old single-wave behaviour.
+        if urgency == "high":
+            wave_size = max(1, len(paper_ids))
+            max_parallel = max_concurrency
+        else:
+            wave_size = max_parallel * 4
+
+        # Fan out per-paper extraction under a bounded semaphore
+        # instead of blocking the event loop on the serial batch;
+        # the async variant uses its own per-thread connections
+        # TODO: Future enhancement - use Claude API with prompts/extraction_prompts.py
+        extraction_result = {
+            "total": len(paper_ids),
+            "successful": 0,
+            "failed": 0,
+            "errors": []
+        }
+        waves = [
+            paper_ids[i:i + wave_size]
+            for i in range(0, len(paper_ids), wave_size)
+        ]
+        for wave in waves:
+            wave_result = await extract_multiple_papers_async(
+                wave,
+                DB_PATH_STR,
+                extraction_depth=extraction_depth,
+                max_concurrency=min(max_concurrency, max_parallel)
+            )
+            extraction_result["successful"] += wave_result["successful"]
+            extraction_result["failed"] += wave_result["failed"]
+            extraction_result["errors"].extend(wave_result["errors"])
+        extraction_result["waves_executed"] = len(waves)
+        extraction_result["papers_per_wave"] = wave_size
+        p.mark("pipeline")
+
+        # Update synthesis_run status and count
+        db = get_db()
+        db.conn.execute(
+            """UPDATE synthesis_runs
+               SET papers_extracted=?, status='synthesizing'
+               WHERE id=?""",
+            (extraction_result["successful"], synthesis_run_id)
+        )
+        db.conn.commit()
+        p.mark("db_write")
+
+        # Prepare response
+        result = {
+            "synthesis_run_id": synthesis_run_id,
+            "papers_extracted": extraction_result["successful"],
+            "extraction_summary": extraction_result,
+            "extraction_depth": extraction_depth,
+            "next_step": "Call synthesize_domains to generate domain syntheses"
+        }
+
+        return _respond(name, result, p)
+
+    elif name == "synthesize_domains":
+        synthesis_run_id = arguments.get("synthesis_run_id")
+        domain_ids = arguments.get("domain_ids", [])
+
+        # Synthesize domains using rule-based MVP synthesizer
+        # TODO: Future enhancement - use Claude Opus 4.5 API with prompts/synthesis_prompts.py
+        synthesis_result = synthesize_multiple_domains(
+            synthesis_run_id,
+            domain_ids,
+            DB_PATH_STR
+        )
+        p.mark("pipeline")
+
+        # Update synthesis_run status and count
+        db = get_db()
+        db.conn.execute(
+            """UPDATE synthesis_runs
+               SET domains_synthesized=?, status='writing'
+               WHERE id=?""",
+            (synthesis_result["successful"], synthesis_run_id)
+        )
+        db.conn.commit()
+        p.mark("db_write")
+
+        # Prepare response
+        result = {
+            "synthesis_run_id": synthesis_run_id,
+            "domains_synthesized": synthesis_result["successful"],
+            "synthesis_summary": synthesis_result,
+            "next_step": "Call generate_section to write individual manuscript sections or generate_manuscript for full orchestration"
+        }
+
+        return _respond(name, result, p)
+
+    elif name == "generate_section":
+        synthesis_run_id = arguments.get("synthesis_run_id")
+        section = arguments.get("section")
+        mode = arguments.get("mode")
+
+        # Get detected domains to determine field
+        db = get_db()
+        cursor = db.conn.execute(
+            "SELECT detected_domains FROM synthesis_runs WHERE id=?",
+            (synthesis_run_id,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return [TextContent(type="text", text=f"Synthesis run {synthesis_run_id} not found")]
+        detected_domains = json.loads(row["detected_domains"])
+        p.mark("db_read")
+
+        # Detect field
+        field = detect_field_from_domains(detected_domains)
+
+        # Generate section
+        section_text = generate_section(
+            synthesis_run_id=synthesis_run_id,
+            section=section,
+            manuscript_mode=mode,
+            db_path=DB_PATH_STR,
+            db=get_db()
+        )
+        p.mark("pipeline")
+
+        # Store section in manuscripts table
+        # Map mode to manuscript mode (manuscripts table uses different enum)
+        manuscript_mode_map = {
+            "primary_research": "research",
+            "review": "review"
+        }
+        manuscript_mode = manuscript_mode_map.get(mode, "research")
+
+        db = get_db()
+        # Check if manuscript record exists
+        cursor = db.conn.execute(
+            "SELECT id FROM manuscripts WHERE synthesis_run_id=?",
+            (synthesis_run_id,)
+        )
+        row = cursor.fetchone()
+
+        if row:
+            # Update existing manuscript
+            manuscript_id = row["id"]
+            db.conn.execute(
+                f"UPDATE manuscripts SET {section}=? WHERE id=?",
+                (section_text, manuscript_id)
+            )
+        else:
+            # Create new manuscript record
+            db.conn.execute(
+                f"""INSERT INTO manuscripts
+                   (synthesis_run_id, mode, {section})
+                   VALUES (?, ?, ?)""",
+                (synthesis_run_id, manuscript_mode, section_text)
+            )
+        db.conn.commit()
+        p.mark("db_write")
+
+        # Prepare response
+        result = {
+            "synthesis_run_id": synthesis_run_id,
+            "section": section,
+            "mode": mode,
+            "field": field,
+            "preview": section_text[:200] if len(section_text) > 200 else section_text,
+            "next_step": "Call generate_section for other sections or generate_manuscript for full orchestration"
+        }
+
+        return _respond(name, result, p)
+
+    elif name == "generate_manuscript":
+        synthesis_run_id = arguments.get("synthesis_run_id")
+        mode = arguments.get("mode")
+        output_path = arguments.get("output_path")
+
+        # Get synthesis run data
+        db = get_db()
+        cursor = db.conn.execute(
+            "SELECT detected_domains, mode as detected_mode FROM synthesis_runs WHERE id=?",
+            (synthesis_run_id,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return [TextContent(type="text", text=f"Synthesis run {synthesis_run_id} not found")]
+
+        detected_domains = json.loads(row["detected_domains"])
+        detected_mode = row["detected_mode"]
+        p.mark("db_read")
+
+        # Detect field for template selection
+        field = detect_field_from_domains(detected_domains)
+
+        # Map mode to manuscript_mode for database
+        mode_map = {
+            "research": "research",
+            "review": "review",
+            "extended-review": "review",
+            "hypothesis": "research"
+        }
+        manuscript_mode = mode_map.get(mode, "research")
+
+        # Determine section generation mode
+        section_mode = "primary_research" if mode in ["research", "hypothesis"] else "review"
+
+        # Check if manuscript already exists
+        db = get_db()
+        cursor = db.conn.execute(
+            "SELECT id FROM manuscripts WHERE synthesis_run_id=?",
+            (synthesis_run_id,)
+        )
+        existing = cursor.fetchone()
+        if existing:
+            manuscript_id = existing["id"]
+        else:
+            # Create new manuscript record
+            cursor = db.conn.execute(
+                "INSERT INTO manuscripts (synthesis_run_id, mode) VALUES (?, ?)",
+                (synthesis_run_id, manuscript_mode)
+            )
+            db.conn.commit()
+            manuscript_id = cursor.lastrowid
+
+        # Generate sections in sequence
+        sections = ["abstract", "introduction", "methods", "results", "discussion"]
+
+        for i, section in enumerate(sections, 1):
+            # Generate section
+            section_text = generate_section(
+                synthesis_run_id=synthesis_run_id,
+                section=section,
+                manuscript_mode=section_mode,
+                db_path=DB_PATH_STR,
+                db=get_db()
+            )
+
+            # Update manuscript with this section
+            db = get_db()
+            db.conn.execute(
+                f"UPDATE manuscripts SET {section}=? WHERE id=?",
+                (section_text, manuscript_id)
+            )
+            db.conn.commit()
+
+        # Assemble full LaTeX document
+        latex_document = assemble_manuscript(
+            synthesis_run_id=synthesis_run_id,
+            db_path=DB_PATH_STR,
+            title="Generated Manuscript",
+            authors="PolyMaX Synthesizer",
+            db=get_db()
+        )
+        p.mark("pipeline")
+
+        # Store latex_content in database
+        db = get_db()
+        db.conn.execute(
+            "UPDATE manuscripts SET latex_content=? WHERE id=?",
+            (latex_document, manuscript_id)
+        )
+        db.conn.commit()
+
+        # Update synthesis_run status to complete
+        db = get_db()
+        db.conn.execute(
+            "UPDATE synthesis_runs SET status='complete' WHERE id=?",
+            (synthesis_run_id,)
+        )
+        db.conn.commit()
+        p.mark("db_write")
+
+        # Optionally save to file
+        if output_path:
+            Path(output_path).write_text(latex_document)
+
+        # Prepare response
+        result = {
+            "status": "complete",
+            "manuscript_id": manuscript_id,
+            "synthesis_run_id": synthesis_run_id,
+            "field": field,
+            "mode": mode,
+            "latex_preview": latex_document[:500] if len(latex_document) > 500 else latex_document,
+            "next_step": "Use pdflatex to compile LaTeX or inspect individual sections"
+        }
+
+        if output_path:
+            result["output_file"] = output_path
+
+        return _respond(name, result, p)
+
+    # Other tools return stub
+    return [TextContent(
+        type="text",
+        text=f"Tool '{name}' not yet implemented"
+    )]
+
+
+
+async def _batch_execute(arguments: dict) -> list[TextContent]:
+    """Run several tool calls as one MCP request.
+
+    Operations may declare depends_on (indices into the operations
+    list). Each dependency layer runs concurrently under a semaphore,
+    so independent calls overlap while chained ones stay ordered, and
+    the client pays protocol overhead once instead of per call.
+    """
+    operations = arguments.get("operations", [])
+    max_concurrent = arguments.get("maxConcurrent", 4)
+    stop_on_error = arguments.get("stopOnError", True)
+
+    outputs = [None] * len(operations)
+    done = set()
+    remaining = set(range(len(operations)))
+    failed = False
+    sem = asyncio.Semaphore(max_concurrent)
+
+    async def _run(index: int) -> str:
+        op = operations[index]
+        async with sem:
+            content = await _dispatch(op.get("name", ""), op.get("arguments", {}))
+        return content[0].text
+
+    while remaining and not (failed and stop_on_error):
+        layer = [
+            i for i in remaining
+            if set(operations[i].get("depends_on", [])) <= done
+        ]
+        if not layer:
+            # Cycle or dependency on a failed/unknown operation
+            for i in remaining:
+                outputs[i] = {"status": "skipped", "reason": "unresolved depends_on"}
+            remaining.clear()
+            break
+
+        results = await asyncio.gather(*(_run(i) for i in layer), return_exceptions=True)
+        for i, outcome in zip(layer, results):
+            remaining.discard(i)
+            if isinstance(outcome, Exception):
+                outputs[i] = {"status": "error", "error": str(outcome)}
+                failed = True
+            else:
+                try:
+                    payload = json.loads(outcome)
+                except ValueError:
+                    payload = outcome
+                outputs[i] = {"status": "ok", "result": payload}
+                done.add(i)
+
+    if remaining:
+        for i in remaining:
+            outputs[i] = {"status": "skipped", "reason": "stopOnError"}
+
+    return [TextContent(type="text", text=_dump({"operations": outputs}))]
+
+
+async def main():
+    """Run server."""
+    # Cap the default executor used by asyncio.to_thread offloads
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2))
+
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(
+            read_stream,
+            write_stream,
+            server.create_initialization_options()
+        )
+
+if __name__ == "__main__":
+    asyncio.run(main())